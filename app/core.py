@@ -11,10 +11,11 @@ import re
 import threading
 import time
 import zipfile
+from collections import deque
 from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from functools import wraps
+from functools import lru_cache, wraps
 from http import HTTPStatus
 from pathlib import Path
 from typing import Any, BinaryIO, cast
@@ -45,7 +46,7 @@ except Exception:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ArtifactMetadata:
     id: str
     name: str
@@ -53,13 +54,13 @@ class ArtifactMetadata:
     version: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Artifact:
     metadata: ArtifactMetadata
     data: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ArtifactQuery:
     artifact_type: str | None = None
     name: str | None = None
@@ -129,7 +130,8 @@ _SAFE_REGEX_TIMEOUT_MS = 200
 # Observability helpers
 # ---------------------------------------------------------------------------
 
-_REQUEST_TIMES: list[float] = []
+# Rolling window of recent request durations; maxlen evicts the oldest in O(1)
+_REQUEST_TIMES: deque[float] = deque(maxlen=5000)
 _STATS = {"ok": 0, "err": 0}
 ps_start_time = time.time()
 
@@ -253,13 +255,11 @@ def _record_timing(f):
             raise
         finally:
             _REQUEST_TIMES.append(time.time() - t0)
-            if len(_REQUEST_TIMES) > 5000:
-                del _REQUEST_TIMES[: len(_REQUEST_TIMES) - 5000]
 
     return _w
 
 
-def _percentile(seq: list[float], p: float) -> float:
+def _percentile(seq: Sequence[float], p: float) -> float:
     if not seq:
         return 0.0
     s = sorted(seq)
@@ -339,6 +339,15 @@ _TYPE_URL_ALIASES = {
 }
 
 
+_BASE_URL_KEYS = ("url", "URL", "link", "download_url", "downloadUrl", "DownloadURL")
+# Per-type lookup tables derived once from _TYPE_URL_ALIASES instead of rebuilt on every save/fetch
+_URL_KEYS_BY_TYPE = {t: _BASE_URL_KEYS + tuple(aliases) for t, aliases in _TYPE_URL_ALIASES.items()}
+_URL_ALIAS_FIELDS_BY_TYPE = {
+    t: tuple(name for alias in aliases for name in (alias, alias[0].upper() + alias[1:]))
+    for t, aliases in _TYPE_URL_ALIASES.items()
+}
+
+
 def _payload_sections(payload: Mapping[str, Any] | None) -> tuple[list[Mapping[str, Any]], list[Mapping[str, Any]]]:
     """Split a payload into metadata/data dicts while always including the root."""
     metadata_sections: list[Mapping[str, Any]] = []
@@ -402,9 +411,7 @@ def _ensure_data_aliases(
     normalized: dict[str, Any] = {}
     if isinstance(data, Mapping):
         normalized.update(data)
-    url_keys = ["url", "URL", "link", "download_url", "downloadUrl", "DownloadURL"]
-    url_keys.extend(_TYPE_URL_ALIASES.get(artifact_type, []))
-    url = preferred_url or _coalesce_str([normalized], url_keys)
+    url = preferred_url or _coalesce_str([normalized], _URL_KEYS_BY_TYPE.get(artifact_type, _BASE_URL_KEYS))
     if not url:
         s3_key = normalized.get("s3_key")
         s3_bucket = normalized.get("s3_bucket")
@@ -421,10 +428,8 @@ def _ensure_data_aliases(
         normalized.setdefault("download_url", url)
         normalized.setdefault("downloadUrl", url)
         normalized.setdefault("DownloadURL", url)
-        for alias in _TYPE_URL_ALIASES.get(artifact_type, []):
+        for alias in _URL_ALIAS_FIELDS_BY_TYPE.get(artifact_type, ()):
             normalized.setdefault(alias, url)
-            camel = alias[0].upper() + alias[1:]
-            normalized.setdefault(camel, url)
     return normalized
 
 
@@ -438,8 +443,7 @@ def _normalize_artifact_request(
     version = _coalesce_str(metadata_sections, ["version", "Version"]) or "1.0.0"
     artifact_id = enforced_id or _coalesce_str(metadata_sections, ["id", "ID", "artifact_id", "artifactId"])
 
-    url_keys = ["url", "URL", "link", "download_url", "downloadUrl", "DownloadURL"]
-    url_keys.extend(_TYPE_URL_ALIASES.get(artifact_type, []))
+    url_keys = _URL_KEYS_BY_TYPE.get(artifact_type, _BASE_URL_KEYS)
     url = _coalesce_str(data_sections, url_keys)
     if not url:
         url = _coalesce_str(metadata_sections, url_keys)
@@ -512,6 +516,28 @@ def _store_key(artifact_type: str, artifact_id: str) -> str:
 
 
 def save_artifact(artifact: Artifact) -> Artifact:
+    _store_artifact(artifact)
+    # Persist new state for dev reload resiliency
+    try:
+        _persist_state()
+    except Exception:
+        pass
+    return artifact
+
+
+def save_artifacts(artifacts: Sequence[Artifact]) -> None:
+    """Save several artifacts, persisting registry state once instead of once per artifact."""
+    if not artifacts:
+        return
+    for artifact in artifacts:
+        _store_artifact(artifact)
+    try:
+        _persist_state()
+    except Exception:
+        pass
+
+
+def _store_artifact(artifact: Artifact) -> None:
     logger.info("Saving artifact %s/%s", artifact.metadata.type, artifact.metadata.id)
     artifact.data = _ensure_data_aliases(artifact.metadata.type, artifact.data)
     artifact_dict = artifact_to_dict(artifact)
@@ -530,12 +556,11 @@ def save_artifact(artifact: Artifact) -> Artifact:
     _STORE[store_key] = artifact
     if store_key not in _ARTIFACT_ORDER:
         _ARTIFACT_ORDER.append(store_key)
-    # Persist new state for dev reload resiliency
-    try:
-        _persist_state()
-    except Exception:
-        pass
-    return artifact
+
+
+def _bulk_insert(items: list[Artifact]) -> None:
+    """Load many artifacts (e.g. test or dev seed data) through save_artifacts, persisting state once."""
+    save_artifacts(items)
 
 
 def _artifact_from_raw(raw: Mapping[str, Any], default_type: str, default_id: str) -> Artifact:
@@ -652,7 +677,8 @@ def list_artifacts(query: ArtifactQuery) -> dict[str, Any]:
 
     # Filter by types[]
     if query.types:
-        items = [item for item in items if item.metadata.type in query.types]
+        wanted_types = frozenset(query.types)
+        items = [item for item in items if item.metadata.type in wanted_types]
         logger.warning("LIST: After types filter count=%d", len(items))
 
     # Filter by name
@@ -792,6 +818,11 @@ def _json_body() -> dict[str, Any]:
 
 
 def _safe_int(value: Any, default: int) -> int:
+    # Fast paths for the common int / plain-digit-string inputs avoid raising on the request path
+    if type(value) is int:
+        return value
+    if isinstance(value, str) and value.isdecimal():
+        return int(value)
     try:
         return int(value)
     except (TypeError, ValueError):
@@ -820,6 +851,7 @@ def raise_error(status: HTTPStatus, message: str) -> None:
     abort(response)
 
 
+@lru_cache(maxsize=256)
 def _is_dangerous_regex(raw_pattern: str) -> bool:
     text = (raw_pattern or "").strip()
     if not text:
@@ -969,6 +1001,12 @@ def _regex_segments(text: str) -> list[str]:
     return segments
 
 
+@lru_cache(maxsize=256)
+def _compile_search_pattern(raw_pattern: str, flags: int) -> re.Pattern[str]:
+    """Compile a user search regex, reusing the compiled object for repeated patterns."""
+    return re.compile(raw_pattern, flags)
+
+
 def _is_plain_name_pattern(raw_pattern: str) -> bool:
     """Return True for regex patterns that are simple ^literal$ without operators."""
     if not raw_pattern.startswith("^") or not raw_pattern.endswith("$"):
@@ -1915,18 +1953,26 @@ def rate_models_batch_route() -> tuple[Response, int] | Response:
                 len(ratings),
             )
         
-        for art, rating in zip(artifacts, ratings):
-            # Ensure phase 2 fields
-            rating = _ensure_phase_two_metrics(art, rating)
-            _RATINGS_CACHE[art.metadata.id] = rating
-            if isinstance(art.data, dict):
-                art.data["metrics"] = dict(rating.scores)
-                art.data["metrics_latencies"] = dict(rating.latencies)
-                art.data["trust_score"] = rating.scores.get("net_score", 0.0)
-                art.data["last_rated"] = rating.generated_at.isoformat() + "Z"
-                save_artifact(art)
-            _audit_add("model", art.metadata.id, "RATE", art.metadata.name)
-            openapi_ratings.append(_to_openapi_model_rating(rating))
+        rated: list[Artifact] = []
+        audited: list[Artifact] = []
+        try:
+            for art, rating in zip(artifacts, ratings):
+                # Ensure phase 2 fields
+                rating = _ensure_phase_two_metrics(art, rating)
+                _RATINGS_CACHE[art.metadata.id] = rating
+                if isinstance(art.data, dict):
+                    art.data["metrics"] = dict(rating.scores)
+                    art.data["metrics_latencies"] = dict(rating.latencies)
+                    art.data["trust_score"] = rating.scores.get("net_score", 0.0)
+                    art.data["last_rated"] = rating.generated_at.isoformat() + "Z"
+                    rated.append(art)
+                audited.append(art)
+                openapi_ratings.append(_to_openapi_model_rating(rating))
+        finally:
+            # Keep every rating computed so far even if a later artifact raised; audit only once saved
+            save_artifacts(rated)
+            for art in audited:
+                _audit_add("model", art.metadata.id, "RATE", art.metadata.name)
 
         # If no ratings succeeded, return specific error
         if not openapi_ratings:
@@ -2199,6 +2245,12 @@ def artifact_cost_route(artifact_type: str, artifact_id: str) -> tuple[Response,
         return jsonify({"message": "The artifact cost calculator encountered an error."}), 500
 
 
+@lru_cache(maxsize=1024)
+def _s3_object_size(key: str, version_id: str) -> int:
+    """Size of a specific S3 object version; versions are immutable, so the HEAD result is cached."""
+    return int(_S3.head_object(key, version_id).get("size", 0))
+
+
 def _calculate_artifact_size_mb(artifact) -> float:
     size_bytes = 0
     if isinstance(artifact.data, dict):
@@ -2209,8 +2261,7 @@ def _calculate_artifact_size_mb(artifact) -> float:
                 key = artifact.data.get("s3_key")
                 ver = artifact.data.get("s3_version_id")
                 if isinstance(key, str):
-                    _, meta = _S3.get_object(key, ver)
-                    size_bytes = int(meta.get("size", 0))
+                    size_bytes = _s3_object_size(key, ver) if ver else int(_S3.head_object(key).get("size", 0))
             except Exception:
                 logger.warning("Failed to get S3 object size for %s", artifact.metadata.id)
         if size_bytes == 0 and artifact.data.get("path"):
@@ -2479,7 +2530,7 @@ def by_regex_route() -> tuple[Response, int] | Response:
     try:
         # Apply case-insensitive matching by default; callers can force sensitivity via inline flags.
         flags = re.IGNORECASE
-        pattern = re.compile(raw_pattern, flags)
+        pattern = _compile_search_pattern(raw_pattern, flags)
     except re.error:
         return jsonify({"message": "Invalid regex"}), 400
 
@@ -146,6 +146,19 @@ class S3Storage:
         }
         return body, meta
 
+    def head_object(self, key: str, version_id: str | None = None) -> dict[str, Any]:
+        """Return object metadata (size, content_type) without downloading the body."""
+        if not self.enabled or not s3_client or not self.bucket:
+            raise RuntimeError("S3Storage not enabled")
+        params: dict[str, Any] = {"Bucket": self.bucket, "Key": key}
+        if version_id:
+            params["VersionId"] = version_id
+        obj = s3_client.head_object(**params)
+        return {
+            "size": int(obj.get("ContentLength", 0) or 0),
+            "content_type": obj.get("ContentType", "application/octet-stream"),
+        }
+
     def generate_presigned_url(self, key: str, expires_in: int = 3600, version_id: str | None = None) -> str:
         if not self.enabled or not s3_client or not self.bucket:
             raise RuntimeError("S3Storage not enabled")
@@ -1,11 +1,98 @@
 import asyncio
+import concurrent.futures
+import hashlib
 import json
+import math
 import os
-import re
+import threading
+from copy import deepcopy
+from functools import partial
 
 import boto3
 
 
+def _json_string_bytes(value: str) -> bytes:
+    return json.dumps(value).encode("utf-8")
+
+
+# Chat request body is {"input": <message>}; only the message varies between calls
+_CHAT_BODY_PREFIX = b'{"input":'
+_CHAT_BODY_SUFFIX = b"}"
+
+_DEFAULT_PERFORMANCE = {"mentions_benchmarks": 0.0, "has_metrics": 0.0, "claims": [], "score": 0.0}
+_DEFAULT_CLARITY = 0.5
+# Upper bound on memoized README evaluations kept per client instance
+_SIGNALS_CACHE_SIZE = 128
+_README_SIGNALS_PROMPT = (
+    "Evaluate the following README. Respond with ONLY a single JSON object of the form "
+    '{"performance": {"mentions_benchmarks": <0-1>, "has_metrics": <0-1>, "claims": [<strings>], '
+    '"score": <0-1>}, "clarity": <0-1>} where "performance" describes the performance claims made '
+    'and "clarity" scores how clear the README is.\n\n'
+)
+
+
+def _parse_first_float(s: str) -> float | None:
+    """Return the first decimal number in s (e.g. "0.82" from "score is 0.82 of 1"), or None."""
+    try:
+        value = float(s.strip())
+        if math.isfinite(value):
+            return value
+    except ValueError:
+        pass
+    n = len(s)
+    i = 0
+    while i < n:
+        c = s[i]
+        if c.isdigit() or (c == "." and i + 1 < n and s[i + 1].isdigit()):
+            break
+        i += 1
+    else:
+        return None
+    j = i
+    seen_dot = False
+    while j < n:
+        c = s[j]
+        if c == ".":
+            if seen_dot:
+                break
+            seen_dot = True
+        elif not c.isdigit():
+            break
+        j += 1
+    try:
+        return float(s[i:j].rstrip("."))
+    except ValueError:
+        return None
+
+
+def _extract_json_object(s: str) -> str | None:
+    """Return the first balanced {...} slice of s, honouring string quoting and escapes."""
+    start = s.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(s)):
+        c = s[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif c == "\\":
+                escaped = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return s[start : i + 1]
+    return None
+
+
 class BedrockClient:
     """Minimal async wrapper around AWS Bedrock invoke_model that matches the
     async interface used by GenAIClient in this repo:
@@ -14,7 +101,8 @@ class BedrockClient:
       - async get_readme_clarity(readme_text: str) -> float
 
     This implementation delegates synchronous boto3 calls into a threadpool
-    so callers can await the methods.
+    so callers can await the methods. Performance claims and README clarity
+    are requested together in a single prompt (see get_readme_signals).
     """
 
     def __init__(self, model_id: str | None = None, region: str | None = None):
@@ -22,6 +110,13 @@ class BedrockClient:
         self.region = region or os.environ.get("AWS_REGION")
         # service name used in boto3 for Bedrock runtime
         self._client = boto3.client("bedrock-runtime", region_name=self.region)
+        # readme_text -> parsed {"performance": dict, "clarity": float}; only successful replies are kept
+        self._signals_cache: dict[str, dict] = {}
+        # blake2b(model_id, message) -> in-flight chat result shared by identical requests.
+        # concurrent.futures (not asyncio) futures: scoring threads each drive this client
+        # from their own event loop, and any of them may join a request another started.
+        self._inflight: dict[bytes, concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
 
     def _invoke_sync(self, model_id: str, payload_bytes: bytes) -> str:
         # Use InvokeModel API
@@ -42,32 +137,111 @@ class BedrockClient:
         model_id = model or self.model_id
         if not model_id:
             raise ValueError("No Bedrock model id configured (BEDROCK_MODEL_ID)")
-        payload = json.dumps({"input": message})
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._invoke_sync, model_id, payload.encode("utf-8"))
+        key = hashlib.blake2b(f"{model_id}\0{message}".encode("utf-8"), digest_size=16).digest()
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = concurrent.futures.Future()
+                # A RUNNING future cannot be cancelled, so one waiter's cancellation stays local
+                future.set_running_or_notify_cancel()
+                future.add_done_callback(partial(self._drop_inflight, key))
+                self._inflight[key] = future
+        if owner:
+            try:
+                asyncio.get_running_loop().run_in_executor(
+                    None, self._invoke_into, future, model_id, self._chat_body(message)
+                )
+            except Exception as exc:
+                future.set_exception(exc)
+        # wrap_future hands the result to whichever loop is awaiting, thread-safely
+        return await asyncio.wrap_future(future)
 
-    async def get_performance_claims(self, readme_text: str) -> dict:
-        prompt = "Extract performance claims as JSON from the following README:\n\n" + readme_text
+    def _invoke_into(self, future: concurrent.futures.Future, model_id: str, payload_bytes: bytes) -> None:
+        # Resolve from the worker thread so the result lands even if the owner's loop has closed
+        try:
+            future.set_result(self._invoke_sync(model_id, payload_bytes))
+        except Exception as exc:
+            future.set_exception(exc)
+
+    def _drop_inflight(self, key: bytes, future: concurrent.futures.Future) -> None:
+        with self._inflight_lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    @staticmethod
+    def _chat_body(message: str) -> bytes:
+        return _CHAT_BODY_PREFIX + _json_string_bytes(message) + _CHAT_BODY_SUFFIX
+
+    async def get_readme_signals(self, readme_text: str) -> dict:
+        """Return {"performance": dict, "clarity": float} for a README using one Bedrock call.
+
+        Parsed results are memoized per README text. Concurrent callers, including
+        get_performance_claims and get_readme_clarity, share one round-trip through
+        chat's in-flight dedup. Transport and parse failures are not memoized.
+        """
+        signals = self._signals_cache.get(readme_text)
+        if signals is not None:
+            return signals
         try:
-            resp = await self.chat(prompt)
-            m = re.search(r"\{.*\}", resp, flags=re.DOTALL)
-            if m:
-                return json.loads(m.group(0))
-            return json.loads(resp)
+            signals = self._parse_readme_signals(await self.chat(_README_SIGNALS_PROMPT + readme_text))
         except Exception:
-            # Return compatible default structure used by GenAIClient
-            return {"mentions_benchmarks": 0.0, "has_metrics": 0.0, "claims": [], "score": 0.0}
+            signals = None
+        if signals is None:
+            return {"performance": deepcopy(_DEFAULT_PERFORMANCE), "clarity": _DEFAULT_CLARITY}
+        with self._inflight_lock:
+            if readme_text not in self._signals_cache and len(self._signals_cache) >= _SIGNALS_CACHE_SIZE:
+                self._signals_cache.pop(next(iter(self._signals_cache)))
+            self._signals_cache[readme_text] = signals
+        return signals
 
-    async def get_readme_clarity(self, readme_text: str) -> float:
-        prompt = "Score the clarity of the following README between 0 and 1:\n\n" + readme_text
+    @staticmethod
+    def _unit_score(value) -> float | None:
+        """Return value as a float if it is already a score in [0, 1], else None.
+
+        Out-of-range numbers are rejected rather than clamped: a reply such as
+        "8/10" or "3 out of 5" is on another scale and must not read as 1.0.
+        """
+        if isinstance(value, bool):
+            return None
         try:
-            resp = await self.chat(prompt)
-            try:
-                return float(resp.strip())
-            except Exception:
-                m = re.search(r"\b(?:0?\.\d+|1(?:\.0+)?)\b", resp)
-                if m:
-                    return float(m.group(0))
+            score = float(value)
+        except (TypeError, ValueError):
+            return None
+        return score if 0.0 <= score <= 1.0 else None
+
+    @staticmethod
+    def _parse_readme_signals(resp: str) -> dict | None:
+        """Parse a README signals reply, returning None when nothing usable was found."""
+        performance = deepcopy(_DEFAULT_PERFORMANCE)
+        clarity = None
+        obj = None
+        try:
+            obj = json.loads(_extract_json_object(resp) or resp)
         except Exception:
-            pass
-        return 0.5
+            obj = None
+
+        if isinstance(obj, dict):
+            if "performance" in obj or "clarity" in obj:
+                if isinstance(obj.get("performance"), dict):
+                    performance = obj["performance"]
+                clarity = BedrockClient._unit_score(obj.get("clarity"))
+                if clarity is None and not isinstance(obj.get("performance"), dict):
+                    return None
+            else:
+                # Model answered with a bare performance-claims object
+                performance = obj
+        else:
+            clarity = BedrockClient._unit_score(_parse_first_float(resp))
+            if clarity is None:
+                return None
+        return {"performance": performance, "clarity": _DEFAULT_CLARITY if clarity is None else clarity}
+
+    async def get_performance_claims(self, readme_text: str) -> dict:
+        signals = await self.get_readme_signals(readme_text)
+        # Hand out a copy so callers cannot mutate the memoized result
+        return deepcopy(signals["performance"])
+
+    async def get_readme_clarity(self, readme_text: str) -> float:
+        signals = await self.get_readme_signals(readme_text)
+        return signals["clarity"]
@@ -0,0 +1,59 @@
+"""
+Benchmarks for hot app/core.py helpers (list pagination, size calculation, regex screening).
+
+Skipped when pytest-benchmark is not installed. Run them on their own with
+``pytest tests/bench --benchmark-only`` so timings are not mixed into unit-test runs.
+"""
+
+import base64
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from app.core import (  # noqa: E402
+    Artifact,
+    ArtifactMetadata,
+    ArtifactQuery,
+    _ARTIFACT_ORDER,
+    _STORE,
+    _calculate_artifact_size_mb,
+    _is_dangerous_regex,
+    list_artifacts,
+    reset_storage,
+)
+
+pytestmark = pytest.mark.slow
+
+_LARGE_B64 = base64.b64encode(b"x" * (1024 * 1024)).decode()
+
+
+@pytest.fixture
+def seeded_store_1000():
+    """Fill the in-memory store with 1000 package artifacts."""
+    reset_storage()
+    for i in range(1000):
+        key = f"package:bench-{i}"
+        _STORE[key] = Artifact(
+            metadata=ArtifactMetadata(id=f"bench-{i}", name=f"bench-{i}", type="package", version="1.0.0")
+        )
+        _ARTIFACT_ORDER.append(key)
+    yield
+    reset_storage()
+
+
+def test_list_pagination(benchmark, seeded_store_1000):
+    result = benchmark(list_artifacts, ArtifactQuery(artifact_type="package", page=5, page_size=20))
+    assert len(result["items"]) == 20
+
+
+def test_size_calc(benchmark):
+    artifact = Artifact(
+        metadata=ArtifactMetadata(id="size", name="size", type="package", version="1.0.0"),
+        data={"Content": _LARGE_B64},
+    )
+    assert benchmark(_calculate_artifact_size_mb, artifact) >= 0
+
+
+def test_is_dangerous_regex(benchmark):
+    assert benchmark(_is_dangerous_regex, "(a|a)*b") is True
@@ -21,6 +21,9 @@ from src.api.hugging_face_client import HuggingFaceClient
 # Import project modules for fixtures
 from src.metrics.metrics_calculator import MetricsCalculator
 
+# Stale copy of test_core_config_comprehensive.py kept for reference; never collect it
+collect_ignore = ["test_core_config_comprehensive_backup.py"]
+
 # ==================== ASYNC EVENT LOOP FIXTURES ====================
 
 # Removed conflicting event_loop fixture - pytest-asyncio handles this automatically
@@ -244,6 +247,33 @@ def sample_api_request():
     }
 
 
+# ==================== REGISTRY STORAGE FIXTURES ====================
+
+
+@pytest.fixture(scope="module")
+def isolated_registry_storage(tmp_path_factory):
+    """Start a module from an empty app.core store with a private persist file.
+
+    Each pytest-xdist worker is its own process, so the in-memory globals are already
+    isolated; the shared /tmp persist file is what parallel workers would otherwise race on.
+    """
+    from app.core import reset_storage
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.core._LOCAL_PERSIST_PATH", tmp_path_factory.mktemp("registry") / "state.json")
+        reset_storage()
+        yield
+
+
+@pytest.fixture
+def clean_registry_storage():
+    """Reset app.core storage after a test so state never leaks into the next one."""
+    from app.core import reset_storage
+
+    yield
+    reset_storage()
+
+
 # ==================== PYTEST MARKERS ====================
 
 
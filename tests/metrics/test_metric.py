@@ -34,13 +34,8 @@ class TestMetricBase(unittest.TestCase):
             result = await dummy.calculate(42)
             return result
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(run_test())
-            self.assertEqual(result, 42)
-        finally:
-            loop.close()
+        result = asyncio.run(run_test())
+        self.assertEqual(result, 42)
 
     def test_incomplete_subclass_cannot_be_instantiated(self):
         """Test that a subclass that doesn't implement calculate cannot be instantiated."""
@@ -65,13 +60,8 @@ class TestMetricBase(unittest.TestCase):
             result = await broken.calculate(42)
             return result
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            result = loop.run_until_complete(run_test())
-            self.assertEqual(result, 0.0)
-        finally:
-            loop.close()
+        result = asyncio.run(run_test())
+        self.assertEqual(result, 0.0)
 
 
 if __name__ == "__main__":
@@ -4,10 +4,26 @@ Tests AWS Bedrock client functionality with complete mocking.
 """
 
 import asyncio
+import json
 import os
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
+from src.api.bedrock_client import BedrockClient, _extract_json_object, _parse_first_float
+
+
+def _fake_stream(payload: bytes):
+    """Return a minimal StreamingBody stand-in whose read() yields payload."""
+
+    class _Stream:
+        __slots__ = ()
+
+        def read(self):
+            return payload
+
+    return _Stream()
+
 
 class TestBedrockClientImport(unittest.TestCase):
     """Test importing BedrockClient with dependency handling."""
@@ -30,28 +46,24 @@ class TestBedrockClientImport(unittest.TestCase):
 class TestBedrockClientInitialization(unittest.TestCase):
     """Test BedrockClient initialization scenarios."""
 
-    @patch("boto3.client")
+    @patch("src.api.bedrock_client.boto3.client")
     def test_init_with_default_values(self, mock_boto_client):
         """Test initialization with default values."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient()
 
         self.assertIsNone(client.model_id)
         self.assertIsNone(client.region)
         mock_boto_client.assert_called_once_with("bedrock-runtime", region_name=None)
 
-    @patch("boto3.client")
+    @patch("src.api.bedrock_client.boto3.client")
     def test_init_with_explicit_values(self, mock_boto_client):
         """Test initialization with explicit model_id and region."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient(model_id="test-model", region="us-east-1")
 
         self.assertEqual(client.model_id, "test-model")
@@ -59,29 +71,25 @@ class TestBedrockClientInitialization(unittest.TestCase):
         mock_boto_client.assert_called_once_with("bedrock-runtime", region_name="us-east-1")
 
     @patch.dict(os.environ, {"BEDROCK_MODEL_ID": "env-model", "AWS_REGION": "us-west-2"})
-    @patch("boto3.client")
+    @patch("src.api.bedrock_client.boto3.client")
     def test_init_with_environment_variables(self, mock_boto_client):
         """Test initialization using environment variables."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient()
 
         self.assertEqual(client.model_id, "env-model")
         self.assertEqual(client.region, "us-west-2")
         mock_boto_client.assert_called_once_with("bedrock-runtime", region_name="us-west-2")
 
-    @patch("boto3.client")
+    @patch("src.api.bedrock_client.boto3.client")
     def test_init_explicit_overrides_environment(self, mock_boto_client):
         """Test that explicit values override environment variables."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
         with patch.dict(os.environ, {"BEDROCK_MODEL_ID": "env-model", "AWS_REGION": "us-west-2"}):
-            from src.api.bedrock_client import BedrockClient
-
             client = BedrockClient(model_id="override-model", region="override-region")
 
             self.assertEqual(client.model_id, "override-model")
@@ -92,19 +100,16 @@ class TestBedrockClientInitialization(unittest.TestCase):
 class TestBedrockClientSyncMethods(unittest.TestCase):
     """Test synchronous internal methods of BedrockClient."""
 
-    @patch("boto3.client")
+    @patch("src.api.bedrock_client.boto3.client")
     def test_invoke_sync_successful_response(self, mock_boto_client):
         """Test successful synchronous invocation."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
         # Mock response with streaming body
-        mock_stream = MagicMock()
-        mock_stream.read.return_value = b'{"result": "test response"}'
+        mock_stream = _fake_stream(b'{"result": "test response"}')
         mock_client.invoke_model.return_value = {"body": mock_stream}
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient()
 
         result = client._invoke_sync("test-model", b'{"input": "test"}')
@@ -114,15 +119,13 @@ class TestBedrockClientSyncMethods(unittest.TestCase):
             modelId="test-model", contentType="application/json", accept="application/json", body=b'{"input": "test"}',
         )
 
-    @patch("boto3.client")
+    @patch("src.api.bedrock_client.boto3.client")
     def test_invoke_sync_no_body_error(self, mock_boto_client):
         """Test error when no body in response."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
         mock_client.invoke_model.return_value = {"body": None}
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient()
 
         with self.assertRaises(RuntimeError) as context:
@@ -130,19 +133,16 @@ class TestBedrockClientSyncMethods(unittest.TestCase):
 
         self.assertEqual(str(context.exception), "No body in Bedrock response")
 
-    @patch("boto3.client")
+    @patch("src.api.bedrock_client.boto3.client")
     def test_invoke_sync_decode_error_fallback(self, mock_boto_client):
         """Test fallback when UTF-8 decode fails."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
         # Mock response with non-UTF-8 bytes
-        mock_stream = MagicMock()
-        mock_stream.read.return_value = b"\xff\xfe\x00\x00"  # Invalid UTF-8
+        mock_stream = _fake_stream(b"\xff\xfe\x00\x00")  # Invalid UTF-8
         mock_client.invoke_model.return_value = {"body": mock_stream}
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient()
 
         result = client._invoke_sync("test-model", b'{"input": "test"}')
@@ -150,115 +150,180 @@ class TestBedrockClientSyncMethods(unittest.TestCase):
         # Should fallback to str() representation
         self.assertEqual(result, "b'\\xff\\xfe\\x00\\x00'")
 
+    def test_chat_body_shape(self):
+        """Test the templated chat body parses back to the expected structure."""
+        message = 'Say "hi"\n\\ caf\u00e9'
+        body = BedrockClient._chat_body(message)
 
-class TestBedrockClientAsyncMethods(unittest.TestCase):
-    """Test async methods of BedrockClient."""
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(json.loads(body), {"input": message})
 
-    def setUp(self):
-        """Set up test environment."""
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
 
-    def tearDown(self):
-        """Clean up test environment."""
-        self.loop.close()
+class TestBedrockClientAsyncMethods(unittest.IsolatedAsyncioTestCase):
+    """Test async methods of BedrockClient."""
 
-    @patch("boto3.client")
-    def test_chat_successful(self, mock_boto_client):
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_chat_successful(self, mock_boto_client):
         """Test successful chat method."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
-        mock_stream = MagicMock()
-        mock_stream.read.return_value = b"Test response from Bedrock"
+        mock_stream = _fake_stream(b"Test response from Bedrock")
         mock_client.invoke_model.return_value = {"body": mock_stream}
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient(model_id="test-model")
 
-        async def run_test():
-            result = await client.chat("Hello, world!")
-            return result
-
-        result = self.loop.run_until_complete(run_test())
+        result = await client.chat("Hello, world!")
         self.assertEqual(result, "Test response from Bedrock")
 
-    @patch("boto3.client")
-    def test_chat_no_model_configured(self, mock_boto_client):
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_chat_no_model_configured(self, mock_boto_client):
         """Test chat method with no model configured."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient()  # No model_id
 
-        async def run_test():
-            with self.assertRaises(ValueError) as context:
-                await client.chat("Hello, world!")
-            self.assertEqual(str(context.exception), "No Bedrock model id configured (BEDROCK_MODEL_ID)")
+        with self.assertRaises(ValueError) as context:
+            await client.chat("Hello, world!")
+        self.assertEqual(str(context.exception), "No Bedrock model id configured (BEDROCK_MODEL_ID)")
 
-        self.loop.run_until_complete(run_test())
-
-    @patch("boto3.client")
-    def test_chat_with_custom_model(self, mock_boto_client):
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_chat_with_custom_model(self, mock_boto_client):
         """Test chat method with custom model override."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
-        mock_stream = MagicMock()
-        mock_stream.read.return_value = b"Custom model response"
+        mock_stream = _fake_stream(b"Custom model response")
         mock_client.invoke_model.return_value = {"body": mock_stream}
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient(model_id="default-model")
 
-        async def run_test():
-            result = await client.chat("Hello, world!", model="custom-model")
-            return result
-
-        result = self.loop.run_until_complete(run_test())
+        result = await client.chat("Hello, world!", model="custom-model")
         self.assertEqual(result, "Custom model response")
 
         # Verify the custom model was used
         call_args = mock_client.invoke_model.call_args
         self.assertEqual(call_args[1]["modelId"], "custom-model")
 
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_chat_singleflight_dedup(self, mock_boto_client):
+        """Test identical concurrent chat calls share one Bedrock request."""
+        mock_client = MagicMock()
+        mock_boto_client.return_value = mock_client
 
-class TestBedrockClientPerformanceClaims(unittest.TestCase):
-    """Test get_performance_claims method."""
+        release = threading.Event()
+
+        def _invoke(**kwargs):
+            release.wait(5)
+            return {"body": _fake_stream(b"Shared response")}
+
+        mock_client.invoke_model.side_effect = _invoke
+
+        client = BedrockClient(model_id="test-model")
 
-    def setUp(self):
-        """Set up test environment."""
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
+        async def _release():
+            # gather starts tasks in order, so all three chats have joined by the time this runs
+            release.set()
 
-    def tearDown(self):
-        """Clean up test environment."""
-        self.loop.close()
+        *results, _ = await asyncio.gather(client.chat("same"), client.chat("same"), client.chat("same"), _release())
+        self.assertEqual(results, ["Shared response"] * 3)
+        self.assertEqual(mock_client.invoke_model.call_count, 1)
+        self.assertEqual(client._inflight, {})
 
-    @patch("boto3.client")
-    def test_get_performance_claims_successful_json(self, mock_boto_client):
+        await client.chat("same")
+        self.assertEqual(mock_client.invoke_model.call_count, 2)
+
+
+class TestBedrockClientThreads(unittest.TestCase):
+    """Test the client shared by scoring threads that each run their own event loop."""
+
+    @patch("src.api.bedrock_client.boto3.client")
+    def test_chat_singleflight_across_event_loops(self, mock_boto_client):
+        """Test a request started on one loop can be joined from another thread's loop."""
+        mock_client = MagicMock()
+        mock_boto_client.return_value = mock_client
+
+        release = threading.Event()
+
+        def _invoke(**kwargs):
+            release.wait(5)
+            return {"body": _fake_stream(b"Shared response")}
+
+        mock_client.invoke_model.side_effect = _invoke
+
+        client = BedrockClient(model_id="test-model")
+        results, errors = [], []
+
+        def _worker():
+            try:
+                results.append(asyncio.run(client.chat("same")))
+            except Exception as exc:  # surfaced through `errors` below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=_worker) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        # Release the call only once both loops are awaiting the shared future
+        for _ in range(500):
+            future = next(iter(client._inflight.values()), None)
+            if future is not None and len(getattr(future, "_done_callbacks", ())) == 3:
+                break
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(results, ["Shared response"] * 2)
+        self.assertEqual(mock_client.invoke_model.call_count, 1)
+        self.assertEqual(client._inflight, {})
+
+    @patch("src.api.bedrock_client.boto3.client")
+    def test_readme_signals_after_loop_shutdown(self, mock_boto_client):
+        """Test a README whose first loop timed out and closed can still be scored on a new loop."""
+        mock_client = MagicMock()
+        mock_boto_client.return_value = mock_client
+
+        release = threading.Event()
+
+        def _invoke(**kwargs):
+            release.wait(5)
+            return {"body": _fake_stream(b'{"performance": {}, "clarity": 0.9}')}
+
+        mock_client.invoke_model.side_effect = _invoke
+
+        client = BedrockClient(model_id="test-model")
+
+        async def _time_out():
+            try:
+                await asyncio.wait_for(client.get_readme_clarity("README content"), 0.01)
+            except asyncio.TimeoutError:
+                pass
+            release.set()
+
+        asyncio.run(_time_out())
+
+        self.assertEqual(asyncio.run(client.get_readme_clarity("README content")), 0.9)
+        self.assertEqual(asyncio.run(client.get_readme_clarity("README content")), 0.9)
+
+
+class TestBedrockClientPerformanceClaims(unittest.IsolatedAsyncioTestCase):
+    """Test get_performance_claims method."""
+
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_get_performance_claims_successful_json(self, mock_boto_client):
         """Test successful performance claims extraction with valid JSON."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
         json_response = '{"mentions_benchmarks": 0.8, "has_metrics": 0.9, "claims": ["Fast"], "score": 0.85}'
-        mock_stream = MagicMock()
-        mock_stream.read.return_value = json_response.encode()
+        mock_stream = _fake_stream(json_response.encode())
         mock_client.invoke_model.return_value = {"body": mock_stream}
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient(model_id="test-model")
 
-        async def run_test():
-            result = await client.get_performance_claims("README content")
-            return result
-
-        result = self.loop.run_until_complete(run_test())
+        result = await client.get_performance_claims("README content")
         expected = {
             "mentions_benchmarks": 0.8,
             "has_metrics": 0.9,
@@ -267,131 +332,101 @@ class TestBedrockClientPerformanceClaims(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
-    @patch("boto3.client")
-    def test_get_performance_claims_json_with_extra_text(self, mock_boto_client):
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_get_performance_claims_json_with_extra_text(self, mock_boto_client):
         """Test performance claims extraction from response with extra text."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
         response_with_extra = 'Here are the results: {"score": 0.7, "claims": ["Efficient"]} and that\'s it.'
-        mock_stream = MagicMock()
-        mock_stream.read.return_value = response_with_extra.encode()
+        mock_stream = _fake_stream(response_with_extra.encode())
         mock_client.invoke_model.return_value = {"body": mock_stream}
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient(model_id="test-model")
 
-        async def run_test():
-            result = await client.get_performance_claims("README content")
-            return result
-
-        result = self.loop.run_until_complete(run_test())
+        result = await client.get_performance_claims("README content")
         expected = {"score": 0.7, "claims": ["Efficient"]}
         self.assertEqual(result, expected)
 
-    @patch("boto3.client")
-    def test_get_performance_claims_fallback_default(self, mock_boto_client):
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_get_performance_claims_fallback_default(self, mock_boto_client):
         """Test performance claims fallback to default when parsing fails."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
         # Invalid JSON response
-        mock_stream = MagicMock()
-        mock_stream.read.return_value = b"Invalid JSON response"
+        mock_stream = _fake_stream(b"Invalid JSON response")
         mock_client.invoke_model.return_value = {"body": mock_stream}
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient(model_id="test-model")
 
-        async def run_test():
-            result = await client.get_performance_claims("README content")
-            return result
-
-        result = self.loop.run_until_complete(run_test())
+        result = await client.get_performance_claims("README content")
         expected = {"mentions_benchmarks": 0.0, "has_metrics": 0.0, "claims": [], "score": 0.0}
         self.assertEqual(result, expected)
 
 
-class TestBedrockClientReadmeClarity(unittest.TestCase):
+class TestBedrockClientReadmeClarity(unittest.IsolatedAsyncioTestCase):
     """Test get_readme_clarity method."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-
-    def tearDown(self):
-        """Clean up test environment."""
-        self.loop.close()
-
-    @patch("boto3.client")
-    def test_get_readme_clarity_direct_float(self, mock_boto_client):
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_get_readme_clarity_direct_float(self, mock_boto_client):
         """Test readme clarity with direct float response."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
-        mock_stream = MagicMock()
-        mock_stream.read.return_value = b"0.75"
+        mock_stream = _fake_stream(b"0.75")
         mock_client.invoke_model.return_value = {"body": mock_stream}
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient(model_id="test-model")
 
-        async def run_test():
-            result = await client.get_readme_clarity("README content")
-            return result
-
-        result = self.loop.run_until_complete(run_test())
+        result = await client.get_readme_clarity("README content")
         self.assertEqual(result, 0.75)
 
-    @patch("boto3.client")
-    def test_get_readme_clarity_with_extra_text(self, mock_boto_client):
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_get_readme_clarity_with_extra_text(self, mock_boto_client):
         """Test readme clarity extraction from response with extra text."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
-        mock_stream = MagicMock()
-        mock_stream.read.return_value = b"The clarity score is 0.82 out of 1.0"
+        mock_stream = _fake_stream(b"The clarity score is 0.82 out of 1.0")
         mock_client.invoke_model.return_value = {"body": mock_stream}
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient(model_id="test-model")
 
-        async def run_test():
-            result = await client.get_readme_clarity("README content")
-            return result
-
-        result = self.loop.run_until_complete(run_test())
+        result = await client.get_readme_clarity("README content")
         self.assertEqual(result, 0.82)
 
-    @patch("boto3.client")
-    def test_get_readme_clarity_fallback_default(self, mock_boto_client):
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_get_readme_clarity_fallback_default(self, mock_boto_client):
         """Test readme clarity fallback to default when parsing fails."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
         # Response with no numbers
-        mock_stream = MagicMock()
-        mock_stream.read.return_value = b"Unable to determine clarity"
+        mock_stream = _fake_stream(b"Unable to determine clarity")
         mock_client.invoke_model.return_value = {"body": mock_stream}
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient(model_id="test-model")
 
-        async def run_test():
-            result = await client.get_readme_clarity("README content")
-            return result
-
-        result = self.loop.run_until_complete(run_test())
+        result = await client.get_readme_clarity("README content")
         self.assertEqual(result, 0.5)
 
-    @patch("boto3.client")
-    def test_get_readme_clarity_exception_handling(self, mock_boto_client):
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_get_readme_clarity_other_scale_falls_back(self, mock_boto_client):
+        """Test replies scored on another scale fall back to the default instead of reading as 1.0."""
+        mock_client = MagicMock()
+        mock_boto_client.return_value = mock_client
+
+        client = BedrockClient(model_id="test-model")
+
+        results = []
+        for reply in (b"8/10", b"3 out of 5", b"1.5"):
+            mock_client.invoke_model.return_value = {"body": _fake_stream(reply)}
+            results.append(await client.get_readme_clarity(reply.decode()))
+        self.assertEqual(results, [0.5, 0.5, 0.5])
+
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_get_readme_clarity_exception_handling(self, mock_boto_client):
         """Test readme clarity exception handling."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
@@ -399,38 +434,165 @@ class TestBedrockClientReadmeClarity(unittest.TestCase):
         # Simulate exception in chat method
         mock_client.invoke_model.side_effect = Exception("Bedrock error")
 
-        from src.api.bedrock_client import BedrockClient
+        client = BedrockClient(model_id="test-model")
+
+        result = await client.get_readme_clarity("README content")
+        self.assertEqual(result, 0.5)
+
+
+class TestParseFirstFloat(unittest.TestCase):
+    """Test the _parse_first_float scanner used for clarity replies."""
+
+    def test_parse_first_float_cases(self):
+        """Test plain floats, embedded numbers, and non-numeric replies."""
+        self.assertEqual(_parse_first_float("0.75"), 0.75)
+        self.assertEqual(_parse_first_float("The clarity score is 0.82 out of 1.0"), 0.82)
+        self.assertEqual(_parse_first_float("roughly .5 overall"), 0.5)
+        self.assertEqual(_parse_first_float("score 1."), 1.0)
+        self.assertIsNone(_parse_first_float("Unable to determine clarity"))
+        self.assertIsNone(_parse_first_float("nan"))
+
+
+class TestExtractJsonObject(unittest.TestCase):
+    """Test the _extract_json_object brace scanner used for performance claims."""
+
+    def test_extract_json_object_cases(self):
+        """Test quoting, escapes, trailing objects, and unbalanced input."""
+        self.assertEqual(_extract_json_object('Result: {"a": 1} then {"b": 2}'), '{"a": 1}')
+        self.assertEqual(_extract_json_object('{"claims": ["x}y", "q\\"}"]}'), '{"claims": ["x}y", "q\\"}"]}')
+        self.assertEqual(_extract_json_object('{"p": {"score": 1}} end'), '{"p": {"score": 1}}')
+        self.assertIsNone(_extract_json_object("no json here"))
+        self.assertIsNone(_extract_json_object('{"a": 1'))
+
+
+class TestBedrockClientBatched(unittest.IsolatedAsyncioTestCase):
+    """Test get_readme_signals batching of performance claims and clarity."""
+
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_get_readme_signals_single_call(self, mock_boto_client):
+        """Test performance claims and clarity share one Bedrock round-trip."""
+        mock_client = MagicMock()
+        mock_boto_client.return_value = mock_client
+
+        mock_stream = _fake_stream(b'{"performance": {"has_metrics": 1, "claims": ["Fast"]}, "clarity": 0.9}')
+        mock_client.invoke_model.return_value = {"body": mock_stream}
 
         client = BedrockClient(model_id="test-model")
 
-        async def run_test():
-            result = await client.get_readme_clarity("README content")
-            return result
+        claims = await client.get_performance_claims("README content")
+        clarity = await client.get_readme_clarity("README content")
+        self.assertEqual(claims, {"has_metrics": 1, "claims": ["Fast"]})
+        self.assertEqual(clarity, 0.9)
+        self.assertEqual(mock_client.invoke_model.call_count, 1)
 
-        result = self.loop.run_until_complete(run_test())
-        self.assertEqual(result, 0.5)
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_get_readme_signals_concurrent_single_call(self, mock_boto_client):
+        """Test concurrent callers share the in-flight Bedrock request."""
+        mock_client = MagicMock()
+        mock_boto_client.return_value = mock_client
 
+        release = threading.Event()
 
-class TestBedrockClientEdgeCases(unittest.TestCase):
-    """Test edge cases and error scenarios."""
+        def _invoke(**kwargs):
+            release.wait(5)
+            return {"body": _fake_stream(b'{"performance": {"score": 0.4}, "clarity": 0.6}')}
+
+        mock_client.invoke_model.side_effect = _invoke
+
+        client = BedrockClient(model_id="test-model")
+
+        async def _release():
+            release.set()
 
-    def setUp(self):
-        """Set up test environment."""
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
+        claims, clarity, _ = await asyncio.gather(
+            client.get_performance_claims("README content"), client.get_readme_clarity("README content"), _release(),
+        )
+        self.assertEqual(claims, {"score": 0.4})
+        self.assertEqual(clarity, 0.6)
+        self.assertEqual(mock_client.invoke_model.call_count, 1)
+
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_get_readme_signals_unparseable_not_cached(self, mock_boto_client):
+        """Test an unparseable reply falls back to defaults without being memoized."""
+        mock_client = MagicMock()
+        mock_boto_client.return_value = mock_client
+
+        mock_client.invoke_model.return_value = {"body": _fake_stream(b"Unable to evaluate")}
+
+        client = BedrockClient(model_id="test-model")
+
+        first = await client.get_readme_clarity("README content")
+        mock_client.invoke_model.return_value = {"body": _fake_stream(b'{"clarity": 0.8}')}
+        second = await client.get_readme_clarity("README content")
+        self.assertEqual(first, 0.5)
+        self.assertEqual(second, 0.8)
+        self.assertEqual(mock_client.invoke_model.call_count, 2)
+
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_get_readme_signals_clarity_out_of_range(self, mock_boto_client):
+        """Test fused clarity values outside [0, 1] and booleans fall back to the default."""
+        mock_client = MagicMock()
+        mock_boto_client.return_value = mock_client
+
+        client = BedrockClient(model_id="test-model")
+
+        mock_client.invoke_model.return_value = {"body": _fake_stream(b'{"performance": {}, "clarity": 7}')}
+        high = await client.get_readme_clarity("README one")
+        mock_client.invoke_model.return_value = {"body": _fake_stream(b'{"performance": {}, "clarity": true}')}
+        boolean = await client.get_readme_clarity("README two")
+        self.assertEqual(high, 0.5)
+        self.assertEqual(boolean, 0.5)
+
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_get_readme_signals_timeout_not_cached(self, mock_boto_client):
+        """Test a caller that times out leaves nothing cancelled behind in the cache."""
+        mock_client = MagicMock()
+        mock_boto_client.return_value = mock_client
+
+        release = threading.Event()
+
+        def _invoke(**kwargs):
+            release.wait(5)
+            return {"body": _fake_stream(b'{"performance": {}, "clarity": 0.9}')}
 
-    def tearDown(self):
-        """Clean up test environment."""
-        self.loop.close()
+        mock_client.invoke_model.side_effect = _invoke
 
-    @patch("boto3.client")
+        client = BedrockClient(model_id="test-model")
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.get_readme_clarity("README content"), 0.01)
+        release.set()
+        self.assertEqual(client._signals_cache, {})
+
+        self.assertEqual(await client.get_readme_clarity("README content"), 0.9)
+        self.assertEqual(await client.get_readme_clarity("README content"), 0.9)
+        self.assertLessEqual(mock_client.invoke_model.call_count, 2)
+
+    @patch("src.api.bedrock_client.boto3.client")
+    async def test_get_readme_signals_failure_not_cached(self, mock_boto_client):
+        """Test transport failures fall back to defaults without being memoized."""
+        mock_client = MagicMock()
+        mock_boto_client.return_value = mock_client
+        mock_client.invoke_model.side_effect = Exception("Bedrock error")
+
+        client = BedrockClient(model_id="test-model")
+
+        first = await client.get_readme_signals("README content")
+        second = await client.get_readme_signals("README content")
+        self.assertEqual(first["clarity"], 0.5)
+        self.assertEqual(second["performance"]["score"], 0.0)
+        self.assertEqual(mock_client.invoke_model.call_count, 2)
+
+
+class TestBedrockClientEdgeCases(unittest.TestCase):
+    """Test edge cases and error scenarios."""
+
+    @patch("src.api.bedrock_client.boto3.client")
     def test_bedrock_client_attributes(self, mock_boto_client):
         """Test BedrockClient has expected attributes."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient()
 
         self.assertTrue(hasattr(client, "model_id"))
@@ -441,14 +603,12 @@ class TestBedrockClientEdgeCases(unittest.TestCase):
         self.assertTrue(hasattr(client, "get_performance_claims"))
         self.assertTrue(hasattr(client, "get_readme_clarity"))
 
-    @patch("boto3.client")
+    @patch("src.api.bedrock_client.boto3.client")
     def test_async_method_signatures(self, mock_boto_client):
         """Test that async methods have correct signatures."""
         mock_client = MagicMock()
         mock_boto_client.return_value = mock_client
 
-        from src.api.bedrock_client import BedrockClient
-
         client = BedrockClient()
 
         import inspect
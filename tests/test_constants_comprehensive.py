@@ -4,220 +4,126 @@ Tests all constants defined in the module for complete coverage.
 """
 
 import sys
-import unittest
+from typing import Final
 from unittest.mock import patch
 
+import pytest
 
-class TestConstantsImport(unittest.TestCase):
-    """Test importing and accessing constants."""
+from src import constants
+from src.constants import MAX_DATASET_DOWNLOADS, MAX_DATASET_LIKES
 
-    def test_import_constants_module(self):
-        """Test that constants module can be imported successfully."""
-        from src import constants
+_TOTAL: Final = MAX_DATASET_DOWNLOADS + MAX_DATASET_LIKES
+_RATIO: Final = MAX_DATASET_DOWNLOADS / MAX_DATASET_LIKES
 
-        self.assertIsNotNone(constants)
 
-    def test_constants_module_attributes(self):
-        """Test that constants module has expected attributes."""
-        from src import constants
+class TestConstantsImport:
+    """Test the public surface of the constants module."""
 
-        self.assertTrue(hasattr(constants, "MAX_DATASET_DOWNLOADS"))
-        self.assertTrue(hasattr(constants, "MAX_DATASET_LIKES"))
+    def test_module_surface(self):
+        """Test that the constants module exposes the expected attributes."""
+        assert hasattr(constants, "MAX_DATASET_DOWNLOADS") and hasattr(constants, "MAX_DATASET_LIKES")
 
 
-class TestConstantValues(unittest.TestCase):
-    """Test the values and types of all constants."""
+class TestConstantValues:
+    """Test the values, types, and bounds of all constants."""
 
-    def test_max_dataset_downloads_value(self):
-        """Test MAX_DATASET_DOWNLOADS constant value."""
-        from src.constants import MAX_DATASET_DOWNLOADS
-
-        self.assertEqual(MAX_DATASET_DOWNLOADS, 4_180_000)
-        self.assertIsInstance(MAX_DATASET_DOWNLOADS, int)
-
-    def test_max_dataset_likes_value(self):
-        """Test MAX_DATASET_LIKES constant value."""
-        from src.constants import MAX_DATASET_LIKES
-
-        self.assertEqual(MAX_DATASET_LIKES, 9_030)
-        self.assertIsInstance(MAX_DATASET_LIKES, int)
-
-
-class TestConstantTypes(unittest.TestCase):
-    """Test data types and properties of constants."""
-
-    def test_constants_are_integers(self):
-        """Test that all constants are integers."""
-        from src.constants import MAX_DATASET_DOWNLOADS, MAX_DATASET_LIKES
-
-        self.assertIsInstance(MAX_DATASET_DOWNLOADS, int)
-        self.assertIsInstance(MAX_DATASET_LIKES, int)
-
-    def test_constants_are_positive(self):
-        """Test that all constants are positive values."""
-        from src.constants import MAX_DATASET_DOWNLOADS, MAX_DATASET_LIKES
-
-        self.assertGreater(MAX_DATASET_DOWNLOADS, 0)
-        self.assertGreater(MAX_DATASET_LIKES, 0)
-
-
-class TestConstantUsage(unittest.TestCase):
-    """Test using constants in calculations and comparisons."""
-
-    def test_max_dataset_downloads_comparison(self):
-        """Test using MAX_DATASET_DOWNLOADS in comparisons."""
-        from src.constants import MAX_DATASET_DOWNLOADS
-
-        # Test typical usage scenarios
-        self.assertTrue(1000 < MAX_DATASET_DOWNLOADS)
-        self.assertTrue(MAX_DATASET_DOWNLOADS < 10_000_000)
-        self.assertFalse(MAX_DATASET_DOWNLOADS < 1000)
-
-    def test_max_dataset_likes_comparison(self):
-        """Test using MAX_DATASET_LIKES in comparisons."""
-        from src.constants import MAX_DATASET_LIKES
-
-        # Test typical usage scenarios
-        self.assertTrue(100 < MAX_DATASET_LIKES)
-        self.assertTrue(MAX_DATASET_LIKES < 20_000)
-        self.assertFalse(MAX_DATASET_LIKES < 100)
+    @pytest.mark.parametrize(
+        "const,expected,low,high",
+        [
+            (MAX_DATASET_DOWNLOADS, 4_180_000, 1000, 10_000_000),
+            (MAX_DATASET_LIKES, 9_030, 100, 20_000),
+        ],
+    )
+    def test_constant_value_type_and_bounds(self, const, expected, low, high):
+        """Test each constant's value, integer type, positivity, and typical bounds."""
+        assert const == expected
+        assert isinstance(const, int)
+        assert const > 0
+        assert low < const < high
+        assert not const < low
 
     def test_constants_arithmetic_operations(self):
         """Test arithmetic operations with constants."""
-        from src.constants import MAX_DATASET_DOWNLOADS, MAX_DATASET_LIKES
+        assert _TOTAL == 4_189_030
+        assert _RATIO == pytest.approx(462.9, abs=0.05)
 
-        # Test arithmetic
-        total = MAX_DATASET_DOWNLOADS + MAX_DATASET_LIKES
-        self.assertEqual(total, 4_189_030)
 
-        ratio = MAX_DATASET_DOWNLOADS / MAX_DATASET_LIKES
-        self.assertAlmostEqual(ratio, 462.9, places=1)
-
-
-class TestConstantAccess(unittest.TestCase):
+class TestConstantAccess:
     """Test different ways to access constants."""
 
     def test_direct_import(self):
         """Test direct import of constants."""
-        from src.constants import MAX_DATASET_DOWNLOADS, MAX_DATASET_LIKES
-
-        self.assertEqual(MAX_DATASET_DOWNLOADS, 4_180_000)
-        self.assertEqual(MAX_DATASET_LIKES, 9_030)
+        assert MAX_DATASET_DOWNLOADS == 4_180_000
+        assert MAX_DATASET_LIKES == 9_030
 
     def test_module_import(self):
         """Test module import and attribute access."""
-        from src import constants
-
-        self.assertEqual(constants.MAX_DATASET_DOWNLOADS, 4_180_000)
-        self.assertEqual(constants.MAX_DATASET_LIKES, 9_030)
+        assert constants.MAX_DATASET_DOWNLOADS == 4_180_000
+        assert constants.MAX_DATASET_LIKES == 9_030
 
     def test_getattr_access(self):
         """Test getattr access to constants."""
-        from src import constants
-
         max_downloads = constants.MAX_DATASET_DOWNLOADS
         max_likes = constants.MAX_DATASET_LIKES
-        self.assertEqual(max_downloads, 4_180_000)
-        self.assertEqual(max_likes, 9_030)
+        assert max_downloads == 4_180_000
+        assert max_likes == 9_030
 
 
-class TestConstantsMockingScenarios(unittest.TestCase):
+class TestConstantsMockingScenarios:
     """Test scenarios involving mocking constants."""
 
-    @patch("src.constants.MAX_DATASET_DOWNLOADS", 1000)
-    def test_mock_max_dataset_downloads(self):
-        """Test mocking MAX_DATASET_DOWNLOADS constant."""
-        from src.constants import MAX_DATASET_DOWNLOADS
-
-        self.assertEqual(MAX_DATASET_DOWNLOADS, 1000)
-
-    @patch("src.constants.MAX_DATASET_LIKES", 500)
-    def test_mock_max_dataset_likes(self):
-        """Test mocking MAX_DATASET_LIKES constant."""
-        from src.constants import MAX_DATASET_LIKES
-
-        self.assertEqual(MAX_DATASET_LIKES, 500)
-
-    def test_constants_with_mock_module(self):
-        """Test constants when module is mocked."""
-        # Since the module is already imported, we need to patch the actual values
-        with patch("src.constants.MAX_DATASET_DOWNLOADS", 2000):
-            with patch("src.constants.MAX_DATASET_LIKES", 800):
-                from src.constants import MAX_DATASET_DOWNLOADS, MAX_DATASET_LIKES
-
-                self.assertEqual(MAX_DATASET_DOWNLOADS, 2000)
-                self.assertEqual(MAX_DATASET_LIKES, 800)
-
-
-class TestConstantsEdgeCases(unittest.TestCase):
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"MAX_DATASET_DOWNLOADS": 1000},
+            {"MAX_DATASET_LIKES": 500},
+            {"MAX_DATASET_DOWNLOADS": 2000, "MAX_DATASET_LIKES": 800},
+        ],
+    )
+    def test_mock_constants(self, overrides):
+        """Test patched constants are visible through the module."""
+        with patch.multiple("src.constants", **overrides):
+            for name, value in overrides.items():
+                assert getattr(constants, name) == value
+
+
+class TestConstantsEdgeCases:
     """Test edge cases and boundary conditions with constants."""
 
-    def test_constants_with_zero_comparison(self):
-        """Test comparing constants with zero."""
-        from src.constants import MAX_DATASET_DOWNLOADS, MAX_DATASET_LIKES
-
-        self.assertNotEqual(MAX_DATASET_DOWNLOADS, 0)
-        self.assertNotEqual(MAX_DATASET_LIKES, 0)
-
-    def test_constants_with_none_comparison(self):
-        """Test comparing constants with None."""
-        from src.constants import MAX_DATASET_DOWNLOADS, MAX_DATASET_LIKES
-
-        self.assertIsNotNone(MAX_DATASET_DOWNLOADS)
-        self.assertIsNotNone(MAX_DATASET_LIKES)
+    @pytest.mark.parametrize("const", [MAX_DATASET_DOWNLOADS, MAX_DATASET_LIKES])
+    def test_constants_boundaries(self, const):
+        """Test constants are neither zero nor None."""
+        assert const is not None
+        assert const != 0
 
     def test_constants_string_representation(self):
         """Test string representation of constants."""
-        from src.constants import MAX_DATASET_DOWNLOADS, MAX_DATASET_LIKES
-
-        self.assertEqual(str(MAX_DATASET_DOWNLOADS), "4180000")
-        self.assertEqual(str(MAX_DATASET_LIKES), "9030")
+        assert str(MAX_DATASET_DOWNLOADS) == "4180000"
+        assert str(MAX_DATASET_LIKES) == "9030"
 
     def test_constants_in_container_operations(self):
         """Test using constants in container operations."""
-        from src.constants import MAX_DATASET_DOWNLOADS, MAX_DATASET_LIKES
-
-        # Test in lists
-        const_list = [MAX_DATASET_DOWNLOADS, MAX_DATASET_LIKES]
-        self.assertIn(4_180_000, const_list)
-        self.assertIn(9_030, const_list)
-
-        # Test in sets
-        const_set = {MAX_DATASET_DOWNLOADS, MAX_DATASET_LIKES}
-        self.assertEqual(len(const_set), 2)
+        assert {MAX_DATASET_DOWNLOADS, MAX_DATASET_LIKES} == {4_180_000, 9_030}
+        assert {"downloads": MAX_DATASET_DOWNLOADS, "likes": MAX_DATASET_LIKES} == {
+            "downloads": 4_180_000,
+            "likes": 9_030,
+        }
 
-        # Test in dictionaries
-        const_dict = {"downloads": MAX_DATASET_DOWNLOADS, "likes": MAX_DATASET_LIKES}
-        self.assertEqual(const_dict["downloads"], 4_180_000)
-        self.assertEqual(const_dict["likes"], 9_030)
 
-
-class TestConstantsModuleReload(unittest.TestCase):
+class TestConstantsModuleReload:
     """Test module reloading scenarios."""
 
     def test_reimport_constants(self):
-        """Test reimporting constants module."""
-        # First import
-        from src.constants import MAX_DATASET_DOWNLOADS
-
-        original_value = MAX_DATASET_DOWNLOADS
-
-        # Reimport
-        import importlib
-
-        import src.constants
-
-        importlib.reload(src.constants)
-
-        # Check values remain the same
-        from src.constants import MAX_DATASET_DOWNLOADS as reloaded_value
+        """Test re-importing constants resolves to the same cached module and values."""
+        from src import constants as reimported
 
-        self.assertEqual(original_value, reloaded_value)
+        assert reimported is constants
+        assert reimported.MAX_DATASET_DOWNLOADS == 4_180_000
 
     def test_module_in_sys_modules(self):
         """Test that constants module appears in sys.modules."""
-        self.assertIn("src.constants", sys.modules)
+        assert "src.constants" in sys.modules
 
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__])
@@ -36,6 +36,7 @@ from app.core import (
     _extract_readme_snippet,
     _regex_segments,
     _is_plain_name_pattern,
+    _compile_search_pattern,
     _artifact_from_raw,
     _duplicate_url_exists,
     raise_error,
@@ -45,6 +46,9 @@ from app.core import (
     blueprint,
 )
 
+_PAT_TEST = re.compile(r"test")
+_PAT_TEST_STAR = re.compile(r"test.*")
+
 
 class TestUtilityFunctions:
     """Test utility and helper functions."""
@@ -182,10 +186,29 @@ class TestMetadataAndDataAliases:
         """Test _ensure_data_aliases with empty data."""
         result = _ensure_data_aliases("package", {})
         assert isinstance(result, dict)
+
+    @pytest.mark.parametrize(
+        "artifact_type,source_key,alias_keys",
+        [
+            ("model", "model_link", ("modelLink", "ModelLink", "model_url", "ModelUrl")),
+            ("dataset", "datasetUrl", ("dataset_link", "DatasetLink", "url", "URL")),
+            ("code", "repo_url", ("code_link", "CodeLink", "RepoUrl", "download_url")),
+        ],
+    )
+    def test_ensure_data_aliases_type_specific(self, artifact_type, source_key, alias_keys):
+        """Test per-type URL keys are found and every alias is filled in."""
+        result = _ensure_data_aliases(artifact_type, {source_key: "https://example.com/x"})
+        assert all(result[key] == "https://example.com/x" for key in alias_keys)
         
 
 class TestAuthenticationFunctions:
     """Test authentication and security functions."""
+
+    @pytest.fixture(scope="class", autouse=True)
+    def _mock_secret(self):
+        # Tokens are signed with the module-level secret, so pin it once for the class
+        with patch("app.core._AUTH_SECRET", "test-secret"):
+            yield
     
     def test_parse_bearer_valid_token(self):
         """Test _parse_bearer with valid bearer token."""
@@ -193,63 +216,52 @@ class TestAuthenticationFunctions:
         result = _parse_bearer(header)
         assert result == "abc123def456"
         
-    def test_parse_bearer_invalid_format(self):
-        """Test _parse_bearer with invalid format."""
-        # Test with various invalid formats - check actual implementation behavior
-        try:
-            result = _parse_bearer("InvalidHeader abc123")
-            # If no exception is raised, check the result
-            assert result is not None or result == ""
-        except ValueError:
-            # Exception is expected for invalid format
-            pass
-            
-        try:
-            result = _parse_bearer("Bearer")  # missing token
-            # If no exception is raised, check the result
-            assert result is not None or result == ""
-        except (ValueError, IndexError):
-            # Exception is expected for missing token
-            pass
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            ("InvalidHeader abc123", "InvalidHeader abc123"),
+            ("Bearer", "Bearer"),
+            ("bearer  tok ", "tok"),
+            ("", ""),
+        ],
+    )
+    def test_parse_bearer_invalid_format(self, header, expected):
+        """Test _parse_bearer passes non-bearer values through stripped instead of raising."""
+        assert _parse_bearer(header) == expected
             
     def test_mint_token_user(self):
         """Test _mint_token for regular user."""
-        with patch('app.core.os.environ.get', return_value='test-secret'):
-            token = _mint_token("testuser", False)
-            assert isinstance(token, str)
-            assert len(token) > 0
+        token = _mint_token("testuser", False)
+        assert isinstance(token, str)
+        assert len(token) > 0
             
     def test_mint_token_admin(self):
         """Test _mint_token for admin user."""
-        with patch('app.core.os.environ.get', return_value='test-secret'):
-            token = _mint_token("admin", True)
-            assert isinstance(token, str)
-            assert len(token) > 0
+        token = _mint_token("admin", True)
+        assert isinstance(token, str)
+        assert len(token) > 0
             
     def test_decode_token_valid(self):
         """Test _decode_token with valid token."""
-        with patch('app.core.os.environ.get', return_value='test-secret'):
-            # First mint a token
-            token = _mint_token("testuser", False)
-            
-            # Then decode it
-            result = _decode_token(token)
-            assert result is not None
-            username, is_admin = result
-            assert username == "testuser"
-            assert is_admin is False
+        # First mint a token
+        token = _mint_token("testuser", False)
+
+        # Then decode it
+        result = _decode_token(token)
+        assert result is not None
+        username, is_admin = result
+        assert username == "testuser"
+        assert is_admin is False
             
     def test_decode_token_invalid(self):
         """Test _decode_token with invalid token."""
-        with patch('app.core.os.environ.get', return_value='test-secret'):
-            result = _decode_token("invalid.token.here")
-            assert result is None
+        result = _decode_token("invalid.token.here")
+        assert result is None
             
     def test_decode_token_malformed(self):
         """Test _decode_token with malformed token."""
-        with patch('app.core.os.environ.get', return_value='test-secret'):
-            result = _decode_token("not-a-jwt-token")
-            assert result is None
+        result = _decode_token("not-a-jwt-token")
+        assert result is None
 
 
 class TestRegexAndSearchFunctions:
@@ -293,35 +305,34 @@ class TestRegexAndSearchFunctions:
         # Result could be None or some other value
         assert result is None or result is not None
         
-    def test_safe_name_match_simple(self):
-        """Test _safe_name_match with simple patterns."""
-        pattern = re.compile(r"test")
-        result1 = _safe_name_match(pattern, "test", exact_match=True,
-                                   raw_pattern="test", context="testing")
-        result2 = _safe_name_match(pattern, "other", exact_match=True,
-                                   raw_pattern="test", context="testing")
-        assert isinstance(result1, bool)
-        assert isinstance(result2, bool)
-        
-    def test_safe_name_match_with_pattern(self):
-        """Test _safe_name_match with regex pattern."""
-        pattern = re.compile(r"test.*")
-        result1 = _safe_name_match(pattern, "test123", exact_match=False,
-                                   raw_pattern="test.*", context="testing")
-        result2 = _safe_name_match(pattern, "other", exact_match=False,
-                                   raw_pattern="test.*", context="testing")
-        assert isinstance(result1, bool)
-        assert isinstance(result2, bool)
-        
-    def test_safe_text_search_success(self):
-        """Test _safe_text_search with successful search."""
-        pattern = re.compile(r"test")
-        result1 = _safe_text_search(pattern, "this is a test",
-                                    raw_pattern="test", context="testing")
-        result2 = _safe_text_search(pattern, "no match here",
-                                    raw_pattern="test", context="testing")
-        assert isinstance(result1, bool)
-        assert isinstance(result2, bool)
+    @pytest.mark.parametrize(
+        "pattern,raw_pattern,exact_match,candidate,expected",
+        [
+            (_PAT_TEST, "test", True, "test", True),
+            (_PAT_TEST, "test", True, "other", False),
+            (_PAT_TEST_STAR, "test.*", False, "test123", True),
+            (_PAT_TEST_STAR, "test.*", False, "other", False),
+        ],
+    )
+    def test_safe_name_match(self, pattern, raw_pattern, exact_match, candidate, expected):
+        """Test _safe_name_match with exact and search-style patterns."""
+        result = _safe_name_match(pattern, candidate, exact_match=exact_match,
+                                  raw_pattern=raw_pattern, context="testing")
+        assert result is expected
+        
+    @pytest.mark.parametrize("text,expected", [("this is a test", True), ("no match here", False)])
+    def test_safe_text_search_success(self, text, expected):
+        """Test _safe_text_search with matching and non-matching text."""
+        result = _safe_text_search(_PAT_TEST, text, raw_pattern="test", context="testing")
+        assert result is expected
+        
+    def test_compile_search_pattern_reuses_compiled(self):
+        """Test _compile_search_pattern returns the cached object and still rejects bad regexes."""
+        first = _compile_search_pattern("react.*", re.IGNORECASE)
+        assert _compile_search_pattern("react.*", re.IGNORECASE) is first
+        assert first.search("React-Utils")
+        with pytest.raises(re.error):
+            _compile_search_pattern("(unclosed", re.IGNORECASE)
         
     def test_regex_segments_simple(self):
         """Test _regex_segments with simple text."""
@@ -335,47 +346,34 @@ class TestRegexAndSearchFunctions:
         assert isinstance(result, list)
         assert len(result) >= 1
         
-    def test_is_plain_name_pattern_behaviors(self):
-        """Test _is_plain_name_pattern with various patterns."""
-        # Test some patterns and verify they return boolean results
-        result1 = _is_plain_name_pattern("simple")
-        result2 = _is_plain_name_pattern("package-name")
-        result3 = _is_plain_name_pattern("test_package")
-        result4 = _is_plain_name_pattern("test.*")
-        result5 = _is_plain_name_pattern("^start")
-        result6 = _is_plain_name_pattern("end$")
-        result7 = _is_plain_name_pattern("test[abc]")
-        
-        # All should return boolean values
-        for result in [result1, result2, result3, result4, result5, result6, result7]:
-            assert isinstance(result, bool)
+    @pytest.mark.parametrize(
+        "pattern,expected",
+        [
+            ("simple", False),
+            ("package-name", False),
+            ("test_package", False),
+            ("test.*", False),
+            ("^start", False),
+            ("end$", False),
+            ("test[abc]", False),
+            ("^simple$", True),
+        ],
+    )
+    def test_is_plain_name_pattern_behaviors(self, pattern, expected):
+        """Test _is_plain_name_pattern only accepts anchored literal patterns."""
+        assert _is_plain_name_pattern(pattern) is expected
 
 
 class TestDataProcessingFunctions:
     """Test data processing and validation functions."""
     
-    def test_coerce_text_string(self):
-        """Test _coerce_text with string input."""
-        assert _coerce_text("hello") == "hello"
-        
-    def test_coerce_text_number(self):
-        """Test _coerce_text with number input."""
-        result1 = _coerce_text(123)
-        result2 = _coerce_text(45.67)
-        # Just verify the function returns a string
-        assert isinstance(result1, str)
-        assert isinstance(result2, str)
-        
-    def test_coerce_text_none(self):
-        """Test _coerce_text with None input."""
-        result = _coerce_text(None)
-        assert isinstance(result, str)
-        
-    def test_coerce_text_complex_object(self):
-        """Test _coerce_text with complex object."""
-        obj = {"key": "value"}
-        result = _coerce_text(obj)
-        assert isinstance(result, str)
+    @pytest.mark.parametrize(
+        "value,expected",
+        [("hello", "hello"), (b"bytes", "bytes"), (123, ""), (45.67, ""), (None, ""), ({"key": "value"}, "")],
+    )
+    def test_coerce_text(self, value, expected):
+        """Test _coerce_text keeps text, decodes bytes, and blanks everything else."""
+        assert _coerce_text(value) == expected
         
     def test_extract_readme_snippet_none(self):
         """Test _extract_readme_snippet with None data."""
@@ -482,19 +480,22 @@ class TestStatePersistenceAndTiming:
         result = test_function(2, 3)
         assert result == 5
         
-    def test_persist_state_function(self):
-        """Test _persist_state function."""
-        with patch('app.core.Path.exists', return_value=True):
-            with patch('app.core.Path.write_text'):
-                # Just test that it runs without error
-                _persist_state()
+    def test_persist_state_function(self, tmp_path, monkeypatch):
+        """Test _persist_state writes the local persist file."""
+        state_path = tmp_path / "state.json"
+        monkeypatch.setattr("app.core._S3.enabled", False)
+        monkeypatch.setattr("app.core._LOCAL_PERSIST_PATH", state_path)
+        _persist_state()
+        assert state_path.exists()
                 
-    def test_load_state_function(self):
-        """Test _load_state function."""
-        with patch('app.core.Path.exists', return_value=True):
-            with patch('app.core.Path.read_text', return_value='{"test": "data"}'):
-                # Just test that it runs without error
-                _load_state()
+    def test_load_state_function(self, tmp_path, monkeypatch):
+        """Test _load_state reads the local persist file."""
+        state_path = tmp_path / "state.json"
+        state_path.write_text('{"test": "data"}')
+        monkeypatch.setattr("app.core._S3.enabled", False)
+        monkeypatch.setattr("app.core._LOCAL_PERSIST_PATH", state_path)
+        # Just test that it runs without error
+        _load_state()
 
 
 if __name__ == "__main__":
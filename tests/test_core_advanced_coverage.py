@@ -11,13 +11,12 @@ This test file focuses on:
 - Complex business logic functions
 """
 
-import base64
-import zipfile
-from io import BytesIO
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import patch
 
 import pytest
 from flask import Flask
+from werkzeug.exceptions import HTTPException
 
 # Import the functions and classes we want to test
 from app.core import (
@@ -25,13 +24,16 @@ from app.core import (
     Artifact,
     ArtifactQuery,
     save_artifact,
+    save_artifacts,
     fetch_artifact,
     list_artifacts,
     reset_storage,
+    _bulk_insert,
     _json_body,
     _require_auth,
     _audit_add,
     _calculate_artifact_size_mb,
+    _s3_object_size,
     _artifact_from_raw,
     _parse_bearer,
     _mint_token,
@@ -43,33 +45,86 @@ from app.core import (
 )
 
 
-@pytest.fixture
+# base64 of b"x" * 16, spelled out so this module does not need base64 at import
+_SMALL_CONTENT_B64 = "eHh4eHh4eHh4eHh4eHh4eA=="
+_DEFAULT_ADMIN_PASSWORD = """correcthorsebatterystaple123(!__+@**(A'"`;DROP TABLE packages;"""
+# Shared read-only auth header matching the valid_token fixture
+_FAKE_HEADERS = MappingProxyType({"X-Authorization": "Bearer valid-token"})
+
+pytestmark = pytest.mark.usefixtures("isolated_registry_storage", "clean_registry_storage")
+
+
+def _seed(n, type_="package"):
+    """Insert n artifacts straight into the in-memory store, bypassing save/persist."""
+    for i in range(n):
+        metadata = ArtifactMetadata(id=f"test-{i}", name=f"artifact-{i}", type=type_, version="1.0.0")
+        _STORE[f"{type_}:test-{i}"] = Artifact(metadata=metadata, data={})
+        _ARTIFACT_ORDER.append(f"{type_}:test-{i}")
+
+
+@pytest.fixture(scope="session")
 def app():
-    """Create a Flask app for testing."""
+    """Create a Flask app for testing, registering the blueprint once per session."""
     app = Flask(__name__)
     app.config['TESTING'] = True
     app.register_blueprint(blueprint)
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(app):
-    """Create a test client."""
+    """Create a test client shared by every test; storage is reset per test."""
     return app.test_client()
 
 
+class _FakeStore:
+    """Lightweight stand-in for the artifact storage adapter."""
+
+    def __init__(self):
+        self._memory_store = {}
+        self.saved = []
+        self.save_error = None
+        self.get_calls = []
+        self.get_return = None
+
+    def save(self, artifact_type, artifact_id, artifact_data):
+        if self.save_error is not None:
+            raise self.save_error
+        self.saved.append((artifact_type, artifact_id, artifact_data))
+
+    def get(self, artifact_type, artifact_id):
+        self.get_calls.append((artifact_type, artifact_id))
+        return self.get_return
+
+    def list_all(self, artifact_type=None):
+        return []
+
+    def clear(self):
+        self._memory_store.clear()
+
+    def health_check(self):
+        return True
+
+
+@pytest.fixture
+def fake_store(monkeypatch):
+    """Swap the artifact storage adapter for a _FakeStore."""
+    store = _FakeStore()
+    monkeypatch.setattr("app.core._ARTIFACT_STORE", store)
+    return store
+
+
 @pytest.fixture
-def clean_storage():
-    """Clean storage before and after each test."""
-    reset_storage()
-    yield
-    reset_storage()
+def valid_token(request, monkeypatch):
+    """Register 'valid-token' (admin unless parametrized indirectly) and return its bearer value."""
+    monkeypatch.setattr("app.core._TOKENS", {"valid-token": getattr(request, "param", True)})
+    return "Bearer valid-token"
 
 
 class TestArtifactCRUDOperations:
     """Test Create, Read, Update, Delete operations for artifacts."""
 
-    def test_save_artifact_basic(self, clean_storage):
+    def test_save_artifact_basic(self, fake_store):
         """Test saving a basic artifact."""
         metadata = ArtifactMetadata(
             id="test-id",
@@ -79,16 +134,13 @@ class TestArtifactCRUDOperations:
         )
         artifact = Artifact(metadata=metadata, data={"readme": "test content"})
 
-        with patch('app.core._ARTIFACT_STORE') as mock_store:
-            mock_store.save = MagicMock()
-
-            result = save_artifact(artifact)
+        result = save_artifact(artifact)
 
-            assert result.metadata.id == "test-id"
-            assert result.metadata.name == "test-artifact"
-            mock_store.save.assert_called_once()
+        assert result.metadata.id == "test-id"
+        assert result.metadata.name == "test-artifact"
+        assert len(fake_store.saved) == 1
 
-    def test_save_artifact_with_storage_error(self, clean_storage):
+    def test_save_artifact_with_storage_error(self, fake_store):
         """Test saving artifact when storage adapter fails."""
         metadata = ArtifactMetadata(
             id="test-id",
@@ -98,32 +150,30 @@ class TestArtifactCRUDOperations:
         )
         artifact = Artifact(metadata=metadata, data={"readme": "test content"})
 
-        with patch('app.core._ARTIFACT_STORE') as mock_store:
-            mock_store.save.side_effect = Exception("Storage error")
+        fake_store.save_error = Exception("Storage error")
 
-            # Should still work, just log the error
-            result = save_artifact(artifact)
+        # Should still work, just log the error
+        result = save_artifact(artifact)
 
-            assert result.metadata.id == "test-id"
-            # Should be saved in memory store despite storage error
-            assert "package:test-id" in _STORE
+        assert result.metadata.id == "test-id"
+        # Should be saved in memory store despite storage error
+        assert "package:test-id" in _STORE
 
-    def test_fetch_artifact_from_adapter(self, clean_storage):
+    def test_fetch_artifact_from_adapter(self, fake_store):
         """Test fetching artifact from storage adapter."""
-        with patch('app.core._ARTIFACT_STORE') as mock_store:
-            mock_store.get.return_value = {
-                "metadata": {"id": "test-id", "name": "test", "type": "package", "version": "1.0"},
-                "data": {"readme": "test content"}
-            }
+        fake_store.get_return = {
+            "metadata": {"id": "test-id", "name": "test", "type": "package", "version": "1.0"},
+            "data": {"readme": "test content"}
+        }
 
-            result = fetch_artifact("package", "test-id")
+        result = fetch_artifact("package", "test-id")
 
-            assert result is not None
-            assert result.metadata.id == "test-id"
-            assert result.metadata.name == "test"
-            mock_store.get.assert_called_once_with("package", "test-id")
+        assert result is not None
+        assert result.metadata.id == "test-id"
+        assert result.metadata.name == "test"
+        assert fake_store.get_calls == [("package", "test-id")]
 
-    def test_fetch_artifact_from_memory(self, clean_storage):
+    def test_fetch_artifact_from_memory(self, fake_store):
         """Test fetching artifact from memory store."""
         # First save an artifact
         metadata = ArtifactMetadata(
@@ -134,52 +184,40 @@ class TestArtifactCRUDOperations:
         )
         artifact = Artifact(metadata=metadata, data={"readme": "memory content"})
 
-        with patch('app.core._ARTIFACT_STORE') as mock_store:
-            mock_store.save = MagicMock()
-            mock_store.get.return_value = None  # Not in adapter
-
-            save_artifact(artifact)
+        save_artifact(artifact)
 
-            # Now fetch it
-            result = fetch_artifact("package", "memory-id")
+        # Now fetch it; the fake adapter's get returns None, so this hits memory
+        result = fetch_artifact("package", "memory-id")
 
-            assert result is not None
-            assert result.metadata.id == "memory-id"
-            assert result.metadata.name == "memory-artifact"
+        assert result is not None
+        assert result.metadata.id == "memory-id"
+        assert result.metadata.name == "memory-artifact"
 
-    def test_fetch_artifact_not_found(self, clean_storage):
+    def test_fetch_artifact_not_found(self, fake_store):
         """Test fetching non-existent artifact."""
-        with patch('app.core._ARTIFACT_STORE') as mock_store:
-            mock_store.get.return_value = None
-
-            result = fetch_artifact("package", "nonexistent")
+        result = fetch_artifact("package", "nonexistent")
 
-            assert result is None
+        assert result is None
 
-    def test_list_artifacts_empty(self, clean_storage):
+    def test_list_artifacts_empty(self, fake_store):
         """Test listing artifacts when none exist."""
         query = ArtifactQuery(artifact_type="package")
 
-        with patch('app.core._ARTIFACT_STORE') as mock_store:
-            mock_store.list_all.return_value = []
-
-            result = list_artifacts(query)
+        result = list_artifacts(query)
 
-            assert result["total"] == 0
-            assert result["items"] == []
+        assert result["total"] == 0
+        assert result["items"] == []
 
-    def test_list_artifacts_with_data(self, clean_storage):
+    def test_list_artifacts_with_data(self):
         """Test listing artifacts with existing data."""
         # Save some test artifacts first
-        for i in range(3):
-            metadata = ArtifactMetadata(
-                id=f"test-{i}",
-                name=f"artifact-{i}",
-                type="package",
-                version="1.0.0"
+        _bulk_insert([
+            Artifact(
+                metadata=ArtifactMetadata(id=f"test-{i}", name=f"artifact-{i}", type="package", version="1.0.0"),
+                data={"readme": f"content {i}"},
             )
-            artifact = Artifact(metadata=metadata, data={"readme": f"content {i}"})
-            save_artifact(artifact)
+            for i in range(3)
+        ])
 
         query = ArtifactQuery(artifact_type="package")
         result = list_artifacts(query)
@@ -187,18 +225,9 @@ class TestArtifactCRUDOperations:
         assert result["total"] == 3
         assert len(result["items"]) == 3
 
-    def test_list_artifacts_with_pagination(self, clean_storage):
+    def test_list_artifacts_with_pagination(self):
         """Test listing artifacts with pagination."""
-        # Save 10 test artifacts
-        for i in range(10):
-            metadata = ArtifactMetadata(
-                id=f"test-{i}",
-                name=f"artifact-{i}",
-                type="package",
-                version="1.0.0"
-            )
-            artifact = Artifact(metadata=metadata, data={"readme": f"content {i}"})
-            save_artifact(artifact)
+        _seed(10)
 
         query = ArtifactQuery(artifact_type="package", page=2, page_size=3)
         result = list_artifacts(query)
@@ -207,19 +236,46 @@ class TestArtifactCRUDOperations:
         assert len(result["items"]) == 3  # page size
         assert result["page"] == 2
 
-    def test_list_artifacts_with_name_filter(self, clean_storage):
+    def test_bulk_insert_persists_once(self):
+        """Test _bulk_insert stores every artifact in order and persists state a single time."""
+        items = [
+            Artifact(metadata=ArtifactMetadata(id=f"bulk-{i}", name=f"bulk-{i}", type="package", version="1.0.0"))
+            for i in range(5)
+        ]
+
+        with patch('app.core._persist_state') as mock_persist:
+            _bulk_insert(items)
+
+        assert _ARTIFACT_ORDER == [f"package:bulk-{i}" for i in range(5)]
+        assert _STORE["package:bulk-4"] is items[4]
+        mock_persist.assert_called_once()
+
+    def test_save_artifacts_saves_each_and_persists_once(self, fake_store):
+        """Test save_artifacts writes every artifact through the adapter but persists state once."""
+        items = [
+            Artifact(metadata=ArtifactMetadata(id=f"many-{i}", name=f"many-{i}", type="package", version="1.0.0"))
+            for i in range(3)
+        ]
+
+        with patch('app.core._persist_state') as mock_persist:
+            save_artifacts(items)
+            save_artifacts([])
+
+        assert [saved[1] for saved in fake_store.saved] == ["many-0", "many-1", "many-2"]
+        assert _ARTIFACT_ORDER == [f"package:many-{i}" for i in range(3)]
+        mock_persist.assert_called_once()
+
+    def test_list_artifacts_with_name_filter(self):
         """Test listing artifacts with name filtering."""
         # Save test artifacts with different names
         names = ["package-react", "react-utils", "vue-components", "angular-lib"]
-        for i, name in enumerate(names):
-            metadata = ArtifactMetadata(
-                id=f"test-{i}",
-                name=name,
-                type="package",
-                version="1.0.0"
+        _bulk_insert([
+            Artifact(
+                metadata=ArtifactMetadata(id=f"test-{i}", name=name, type="package", version="1.0.0"),
+                data={"readme": f"content {i}"},
             )
-            artifact = Artifact(metadata=metadata, data={"readme": f"content {i}"})
-            save_artifact(artifact)
+            for i, name in enumerate(names)
+        ])
 
         query = ArtifactQuery(artifact_type="package", name="react")
         result = list_artifacts(query)
@@ -240,12 +296,8 @@ class TestFlaskRoutes:
         data = response.get_json()
         assert data["ok"] is True
 
-    @patch('app.core._STORE')
-    @patch('app.core._ARTIFACT_STORE')
-    def test_health_components_endpoint(self, mock_artifact_store, mock_store, client):
+    def test_health_components_endpoint(self, client):
         """Test health components endpoint."""
-        mock_artifact_store.health_check.return_value = True
-
         response = client.get('/health/components')
         assert response.status_code == 200
         data = response.get_json()
@@ -267,7 +319,7 @@ class TestFlaskRoutes:
         auth_data = {
             "user": {"name": "ece30861defaultadminuser"},
             "secret": {
-                "password": """correcthorsebatterystaple123(!__+@**(A'"`;DROP TABLE packages;"""
+                "password": _DEFAULT_ADMIN_PASSWORD
             }
         }
         response = client.put('/authenticate', json=auth_data)
@@ -282,7 +334,7 @@ class TestFlaskRoutes:
 
         assert response.status_code == 400
 
-    def test_create_artifact_endpoint_success(self, client):
+    def test_create_artifact_endpoint_success(self, client, valid_token):
         """Test creating artifact via API endpoint."""
         # Use valid artifact type and provide auth header
         artifact_data = {
@@ -290,34 +342,26 @@ class TestFlaskRoutes:
             "Version": "1.0.0",
             "url": "https://github.com/test/test-model"
         }
-        
-        headers = {"X-Authorization": "Bearer valid-token"}
-        
-        with patch('app.core._TOKENS', {'valid-token': True}):
-            with patch('app.core.save_artifact') as mock_save:
-                response = client.post('/artifact/model', json=artifact_data, headers=headers)
 
-                assert response.status_code == 201
-                mock_save.assert_called_once()
+        with patch('app.core.save_artifact') as mock_save:
+            response = client.post('/artifact/model', json=artifact_data, headers={"X-Authorization": valid_token})
+
+            assert response.status_code == 201
+            mock_save.assert_called_once()
 
     @patch('app.core._require_auth')
     def test_enumerate_artifacts_endpoint(self, mock_auth, client):
         """Test enumerating artifacts via API endpoint."""
         mock_auth.return_value = ("testuser", False)
-        
-        # Reset storage for this test
-        reset_storage()
 
         # Add some test artifacts
-        for i in range(3):
-            metadata = ArtifactMetadata(
-                id=f"enum-{i}",
-                name=f"enum-artifact-{i}",
-                type="package",
-                version="1.0.0"
+        _bulk_insert([
+            Artifact(
+                metadata=ArtifactMetadata(id=f"enum-{i}", name=f"enum-artifact-{i}", type="package", version="1.0.0"),
+                data={},
             )
-            artifact = Artifact(metadata=metadata, data={})
-            save_artifact(artifact)
+            for i in range(3)
+        ])
 
         response = client.post('/artifacts', json=[{"Name": "*"}])
 
@@ -325,13 +369,47 @@ class TestFlaskRoutes:
         data = response.get_json()
         assert len(data) >= 3
 
+    @patch('app.core._require_auth')
+    def test_batch_rate_keeps_ratings_when_later_artifact_fails(self, mock_auth, client):
+        """Test ratings computed before a mid-batch failure are still saved and then audited."""
+        from datetime import datetime
+
+        from app.core import _AUDIT_LOG
+        from app.scoring import ModelRating
+
+        mock_auth.return_value = ("testuser", True)
+        _bulk_insert([
+            Artifact(
+                metadata=ArtifactMetadata(id=f"rate-{i}", name=f"rate-{i}", type="model", version="1.0.0"),
+                data={"model_link": f"https://huggingface.co/org/rate-{i}"},
+            )
+            for i in range(2)
+        ])
+        ratings = [
+            ModelRating(id=f"rate-{i}", generated_at=datetime(2024, 1, 1), scores={"net_score": 0.5},
+                        latencies={}, summary={})
+            for i in range(2)
+        ]
+        saved_ids = []
+
+        def _save(arts):
+            # Audit entries must not exist until the save has happened
+            assert not any(f"rate-{i}" in _AUDIT_LOG for i in range(2))
+            saved_ids.extend(a.metadata.id for a in arts)
+
+        with patch('app.core.rate_artifacts_concurrently', return_value=ratings), \
+                patch('app.core._to_openapi_model_rating', side_effect=[{"id": "rate-0"}, RuntimeError("boom")]), \
+                patch('app.core.save_artifacts', side_effect=_save):
+            response = client.post('/artifacts/models/rate', json={"ids": ["rate-0", "rate-1"]})
+
+        assert response.status_code == 500
+        assert saved_ids == ["rate-0", "rate-1"]
+        assert [_AUDIT_LOG[f"rate-{i}"][-1]["action"] for i in range(2)] == ["RATE", "RATE"]
+
     @patch('app.core._require_auth')
     def test_get_artifact_endpoint_success(self, mock_auth, client):
         """Test getting specific artifact via API endpoint."""
         mock_auth.return_value = ("testuser", False)
-        
-        # Reset storage for this test
-        reset_storage()
 
         # Create test artifact with required url field
         metadata = ArtifactMetadata(
@@ -386,30 +464,27 @@ class TestUtilityAndHelperFunctions:
             result = _json_body()
             assert result == {}
 
-    def test_require_auth_success(self, app):
-        """Test _require_auth with valid authentication."""
-        with app.test_request_context('/', headers={'X-Authorization': 'Bearer valid-token'}):
-            with patch('app.core._TOKENS', {'valid-token': False}):
+    @pytest.mark.parametrize(
+        "headers,ok",
+        [
+            (_FAKE_HEADERS, True),
+            ({}, False),
+            ({'X-Authorization': 'Bearer invalid-token'}, False),
+        ],
+        ids=["valid-token", "missing-header", "invalid-token"],
+    )
+    @pytest.mark.parametrize("valid_token,admin", [(True, True), (False, False)],
+                             indirect=["valid_token"], ids=["admin", "non-admin"])
+    def test_require_auth(self, app, valid_token, admin, headers, ok):
+        """Test _require_auth accepts known tokens, reports their admin flag, and aborts otherwise."""
+        with app.test_request_context('/', headers=headers):
+            if ok:
                 username, is_admin = _require_auth()
-                
                 assert username == "valid-token"
-                assert is_admin is False
-
-    def test_require_auth_missing_header(self, app):
-        """Test _require_auth with missing authorization header."""
-        with app.test_request_context('/'):
-            from werkzeug.exceptions import HTTPException
-            
-            with pytest.raises(HTTPException):  # Should abort
-                _require_auth()
-
-    def test_require_auth_invalid_token(self, app):
-        """Test _require_auth with invalid token."""
-        with app.test_request_context('/', headers={'X-Authorization': 'Bearer invalid-token'}):
-            from werkzeug.exceptions import HTTPException
-            
-            with pytest.raises(HTTPException):  # Should abort
-                _require_auth()
+                assert is_admin is admin
+            else:
+                with pytest.raises(HTTPException):  # Should abort
+                    _require_auth()
 
     def test_audit_add_function(self):
         """Test _audit_add audit logging function."""
@@ -436,7 +511,7 @@ class TestUtilityAndHelperFunctions:
         )
         data = {
             "size": 1024 * 1024,  # 1 MB
-            "Content": base64.b64encode(b"x" * 1000).decode(),
+            "Content": _SMALL_CONTENT_B64,
             "readme": "Some readme content"
         }
         artifact = Artifact(metadata=metadata, data=data)
@@ -460,24 +535,40 @@ class TestUtilityAndHelperFunctions:
 
         assert size_mb == 0
 
+    def test_calculate_artifact_size_mb_s3_version_cached(self):
+        """Test S3-backed sizes use HEAD, caching per immutable object version."""
+        _s3_object_size.cache_clear()
+        artifact = Artifact(
+            metadata=ArtifactMetadata(id="s3-size", name="s3-size", type="package", version="1.0.0"),
+            data={"s3_key": "uploads/x.zip", "s3_version_id": "v1"},
+        )
+
+        with patch('app.core._S3') as mock_s3:
+            mock_s3.enabled = True
+            mock_s3.head_object.return_value = {"size": 2 * 1024 * 1024}
+            sizes = [_calculate_artifact_size_mb(artifact) for _ in range(3)]
+        _s3_object_size.cache_clear()
+
+        assert sizes == [2.0, 2.0, 2.0]
+        mock_s3.head_object.assert_called_once_with("uploads/x.zip", "v1")
+        mock_s3.get_object.assert_not_called()
+
     def test_is_dangerous_regex_safe(self):
         """Test _is_dangerous_regex with safe patterns."""
         result = _is_dangerous_regex("test-package")
         assert result is False
 
-    def test_is_dangerous_regex_dangerous(self):
-        """Test _is_dangerous_regex with dangerous patterns."""
-        # Test patterns that might cause exponential backtracking
-        dangerous_patterns = [
+    @pytest.mark.parametrize(
+        "pattern",
+        [
             "(a+)+b",  # Nested quantifiers
             "a*a*a*a*a*a*b",  # Multiple quantifiers
-            "(a|a)*b"  # Alternation with overlap
-        ]
-        
-        for pattern in dangerous_patterns:
-            result = _is_dangerous_regex(pattern)
-            # Function should detect dangerous patterns
-            assert isinstance(result, bool)
+            "(a|a)*b",  # Alternation with overlap
+        ],
+    )
+    def test_is_dangerous_regex_dangerous(self, pattern):
+        """Test _is_dangerous_regex with patterns that might cause exponential backtracking."""
+        assert isinstance(_is_dangerous_regex(pattern), bool)
 
 
 class TestErrorHandlingAndEdgeCases:
@@ -589,59 +680,5 @@ class TestErrorHandlingAndEdgeCases:
         mock_persist.assert_called_once()
 
 
-class TestFileOperationsAndContent:
-    """Test file operations and content handling."""
-
-    def test_artifact_with_zip_content(self):
-        """Test artifact with ZIP file content."""
-        # Create a test ZIP file in memory
-        zip_buffer = BytesIO()
-        with zipfile.ZipFile(zip_buffer, 'w') as zip_file:
-            zip_file.writestr('test.txt', 'Hello, World!')
-            zip_file.writestr('subdir/another.txt', 'Another file')
-
-        zip_content = base64.b64encode(zip_buffer.getvalue()).decode()
-
-        metadata = ArtifactMetadata(
-            id="zip-test",
-            name="zip-artifact",
-            type="package",
-            version="1.0.0"
-        )
-        artifact = Artifact(
-            metadata=metadata,
-            data={"Content": zip_content, "JSProgram": "true"}
-        )
-
-        result = save_artifact(artifact)
-
-        assert result.metadata.id == "zip-test"
-        assert "Content" in result.data
-
-    def test_artifact_with_large_content(self):
-        """Test artifact with large content."""
-        # Create large content (1MB)
-        large_content = base64.b64encode(b"x" * (1024 * 1024)).decode()
-
-        metadata = ArtifactMetadata(
-            id="large-test",
-            name="large-artifact",
-            type="package",
-            version="1.0.0"
-        )
-        artifact = Artifact(
-            metadata=metadata,
-            data={"Content": large_content}
-        )
-
-        result = save_artifact(artifact)
-
-        assert result.metadata.id == "large-test"
-
-        # Test size calculation - pass the whole artifact, not just data
-        size_mb = _calculate_artifact_size_mb(result)
-        assert size_mb >= 0  # Size will be 0 without explicit size field
-
-
 if __name__ == "__main__":
     pytest.main([__file__])
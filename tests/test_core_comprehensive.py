@@ -28,6 +28,7 @@ from app.core import (
     fetch_artifact,
     list_artifacts,
     reset_storage,
+    _bulk_insert,
     _artifact_from_raw,
     _duplicate_url_exists,
     _persist_state,
@@ -36,53 +37,56 @@ from app.core import (
 )
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _no_persist():
+    """Make _persist_state a no-op here; persistence round trips are tested in test_core_additional_coverage."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.core._persist_state", lambda: None)
+        yield
+
+
+@pytest.fixture(scope="module")
+def sample_metadata():
+    """Canonical metadata shared by tests that only read it."""
+    return ArtifactMetadata(id="test-id", name="test-package", type="model", version="1.0.0")
+
+
+@pytest.fixture(scope="module")
+def default_query():
+    """Default ArtifactQuery; list_artifacts only mutates a query whose name is "*"."""
+    return ArtifactQuery()
+
+
 class TestDataModels:
     """Test the core data model classes."""
 
-    def test_artifact_metadata_creation(self):
+    def test_artifact_metadata_creation(self, sample_metadata):
         """Test ArtifactMetadata dataclass creation."""
-        metadata = ArtifactMetadata(
-            id="test-id",
-            name="test-package", 
-            type="model",
-            version="1.0.0"
-        )
-        
+        metadata = sample_metadata
+
         assert metadata.id == "test-id"
         assert metadata.name == "test-package"
         assert metadata.type == "model"
         assert metadata.version == "1.0.0"
 
-    def test_artifact_creation_default_data(self):
+    def test_artifact_creation_default_data(self, sample_metadata):
         """Test Artifact creation with default data field."""
-        metadata = ArtifactMetadata(
-            id="test-id",
-            name="test-package", 
-            type="model",
-            version="1.0.0"
-        )
-        artifact = Artifact(metadata=metadata)
+        artifact = Artifact(metadata=sample_metadata)
         
-        assert artifact.metadata == metadata
+        assert artifact.metadata == sample_metadata
         assert artifact.data == {}
 
-    def test_artifact_creation_with_data(self):
+    def test_artifact_creation_with_data(self, sample_metadata):
         """Test Artifact creation with custom data."""
-        metadata = ArtifactMetadata(
-            id="test-id",
-            name="test-package", 
-            type="model",
-            version="1.0.0"
-        )
         data = {"url": "https://github.com/test/repo", "description": "Test package"}
-        artifact = Artifact(metadata=metadata, data=data)
+        artifact = Artifact(metadata=sample_metadata, data=data)
         
-        assert artifact.metadata == metadata
+        assert artifact.metadata == sample_metadata
         assert artifact.data == data
 
-    def test_artifact_query_defaults(self):
+    def test_artifact_query_defaults(self, default_query):
         """Test ArtifactQuery default values."""
-        query = ArtifactQuery()
+        query = default_query
         
         assert query.artifact_type is None
         assert query.name is None
@@ -110,37 +114,22 @@ class TestDataModels:
 class TestUtilityFunctions:
     """Test utility and helper functions."""
 
-    def test_percentile_empty_list(self):
-        """Test _percentile with empty list."""
-        result = _percentile([], 0.5)
-        assert result == 0.0
-
-    def test_percentile_single_element(self):
-        """Test _percentile with single element."""
-        result = _percentile([5.0], 0.5)
-        assert result == 5.0
-
-    def test_percentile_multiple_elements(self):
-        """Test _percentile with multiple elements."""
-        data = [1.0, 2.0, 3.0, 4.0, 5.0]
-        
-        # 50th percentile (median)
-        result = _percentile(data, 0.5)
-        assert result == 3.0
-        
-        # 90th percentile - actual algorithm returns 4.0 for this data
-        result = _percentile(data, 0.9)
-        assert result == 4.0
-        
-        # 10th percentile
-        result = _percentile(data, 0.1)
-        assert result == 1.0
-
-    def test_percentile_unsorted_data(self):
-        """Test _percentile sorts data correctly."""
-        data = [5.0, 1.0, 3.0, 2.0, 4.0]
-        result = _percentile(data, 0.5)
-        assert result == 3.0
+    @pytest.mark.parametrize(
+        "data,q,expected",
+        [
+            ([], 0.5, 0.0),
+            ([5.0], 0.5, 5.0),
+            ([1.0, 2.0, 3.0, 4.0, 5.0], 0.5, 3.0),
+            # The index is truncated, so p90 of five points lands on the fourth
+            ([1.0, 2.0, 3.0, 4.0, 5.0], 0.9, 4.0),
+            ([1.0, 2.0, 3.0, 4.0, 5.0], 0.1, 1.0),
+            ([5.0, 1.0, 3.0, 2.0, 4.0], 0.5, 3.0),
+        ],
+        ids=["empty", "single", "median", "p90", "p10", "unsorted"],
+    )
+    def test_percentile(self, data, q, expected):
+        """Test _percentile across empty, single, sorted and unsorted inputs."""
+        assert _percentile(data, q) == expected
 
     def test_payload_sections_none_payload(self):
         """Test _payload_sections with None payload."""
@@ -218,56 +207,40 @@ class TestUtilityFunctions:
         result = _coalesce_str(sections, ["version"])
         assert result == "123"
 
-    def test_derive_name_from_url_none(self):
-        """Test _derive_name_from_url with None."""
-        result = _derive_name_from_url(None)
-        assert result == "artifact"  # Default fallback
-
-    def test_derive_name_from_url_empty(self):
-        """Test _derive_name_from_url with empty string."""
-        result = _derive_name_from_url("")
-        assert result == "artifact"  # Default fallback
-
-    def test_derive_name_from_url_github(self):
-        """Test _derive_name_from_url with GitHub URL."""
-        url = "https://github.com/user/repo-name"
-        result = _derive_name_from_url(url)
-        assert result == "repo-name"
-
-    def test_derive_name_from_url_github_with_git_suffix(self):
-        """Test _derive_name_from_url with .git suffix."""
-        url = "https://github.com/user/repo-name.git"
-        result = _derive_name_from_url(url)
-        # secure_filename may not remove .git suffix
-        assert "repo-name" in result
-
-    def test_derive_name_from_url_complex_path(self):
-        """Test _derive_name_from_url extracts last path segment."""
-        url = "https://example.com/path/to/package-name"
-        result = _derive_name_from_url(url)
-        assert result == "package-name"
-
-    def test_derive_name_from_url_with_query_params(self):
-        """Test _derive_name_from_url extracts package name.""" 
-        url = "https://example.com/package?version=1.0"
-        result = _derive_name_from_url(url)
-        # secure_filename processes the entire last path segment
-        assert "package" in result
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            (None, "artifact"),
+            ("", "artifact"),
+            ("https://github.com/user/repo-name", "repo-name"),
+            ("https://example.com/path/to/package-name", "package-name"),
+        ],
+        ids=["none", "empty", "github", "nested_path"],
+    )
+    def test_derive_name_from_url(self, url, expected):
+        """Test _derive_name_from_url falls back to "artifact" and takes the last path segment."""
+        assert _derive_name_from_url(url) == expected
+
+    # secure_filename keeps the suffix/query text, so only the base name is pinned here
+    @pytest.mark.parametrize(
+        "url,expected_substr",
+        [
+            ("https://github.com/user/repo-name.git", "repo-name"),
+            ("https://example.com/package?version=1.0", "package"),
+        ],
+        ids=["git_suffix", "query_params"],
+    )
+    def test_derive_name_from_url_sanitized(self, url, expected_substr):
+        """Test _derive_name_from_url keeps the package name when the segment needs sanitizing."""
+        assert expected_substr in _derive_name_from_url(url)
 
 
 class TestMetadataAndDataAliases:
     """Test metadata and data alias functions."""
 
-    def test_ensure_metadata_aliases(self):
+    def test_ensure_metadata_aliases(self, sample_metadata):
         """Test _ensure_metadata_aliases creates all expected aliases."""
-        metadata = ArtifactMetadata(
-            id="test-id",
-            name="test-package",
-            type="model",
-            version="1.2.3"
-        )
-        
-        result = _ensure_metadata_aliases(metadata)
+        result = _ensure_metadata_aliases(sample_metadata)
         
         # Check basic field variations are present
         assert result["id"] == "test-id"
@@ -279,8 +252,8 @@ class TestMetadataAndDataAliases:
         assert result["type"] == "model"
         assert result["Type"] == "model"
         
-        assert result["version"] == "1.2.3"
-        assert result["Version"] == "1.2.3"
+        assert result["version"] == "1.0.0"
+        assert result["Version"] == "1.0.0"
 
     def test_ensure_data_aliases_with_data(self):
         """Test _ensure_data_aliases with existing data."""
@@ -313,13 +286,10 @@ class TestArtifactFunctions:
         result = _store_key("dataset", "another-id")
         assert result == "dataset:another-id"
 
-    def test_artifact_to_dict(self):
+    def test_artifact_to_dict(self, sample_metadata):
         """Test artifact_to_dict conversion."""
-        metadata = ArtifactMetadata(
-            id="test-id", name="test-package", type="model", version="1.0"
-        )
         data = {"url": "https://example.com"}
-        artifact = Artifact(metadata=metadata, data=data)
+        artifact = Artifact(metadata=sample_metadata, data=data)
         
         result = artifact_to_dict(artifact)
         
@@ -327,7 +297,7 @@ class TestArtifactFunctions:
         assert result["metadata"]["id"] == "test-id"
         assert result["metadata"]["name"] == "test-package"
         assert result["metadata"]["type"] == "model"
-        assert result["metadata"]["version"] == "1.0"
+        assert result["metadata"]["version"] == "1.0.0"
         
         assert "data" in result
         assert result["data"]["url"] == "https://example.com"
@@ -377,18 +347,38 @@ class TestArtifactFunctions:
         assert result.metadata.name == "test-id" or result.metadata.name == ""
 
 
-class TestStorageOperations:
-    """Test storage and persistence operations."""
+@pytest.fixture
+def clean_storage():
+    """Empty the store before a test that mutates it."""
+    reset_storage()
+    yield
+    reset_storage()
+
+
+@pytest.fixture(scope="class")
+def seeded_storage():
+    """Seed two models and a dataset once for the read-only storage tests."""
+    reset_storage()
+    _bulk_insert(
+        [
+            Artifact(metadata=ArtifactMetadata(id="model-0", name="package-0", type="model", version="1.0")),
+            Artifact(
+                metadata=ArtifactMetadata(id="model-1", name="package-1", type="model", version="1.0"),
+                data={"url": "https://example.com/unique"},
+            ),
+            Artifact(metadata=ArtifactMetadata(id="dataset-0", name="package-0", type="dataset", version="1.0")),
+        ]
+    )
+    yield
+    reset_storage()
 
-    def setUp(self):
-        """Reset storage before each test."""
-        reset_storage()
+
+@pytest.mark.usefixtures("clean_storage")
+class TestStorageOperations:
+    """Test storage and persistence operations that mutate the store."""
 
     def test_save_and_fetch_artifact(self):
         """Test saving and fetching an artifact."""
-        # Reset storage first
-        reset_storage()
-        
         metadata = ArtifactMetadata(
             id="test-id", name="test-package", type="model", version="1.0"
         )
@@ -404,79 +394,41 @@ class TestStorageOperations:
         assert fetched.metadata.id == "test-id"
         assert fetched.data["url"] == "https://example.com"
 
+    def test_list_artifacts_empty(self, default_query):
+        """Test listing artifacts when storage is empty."""
+        result = list_artifacts(default_query)
+        
+        # API returns "items" not "artifacts", and "total" not "totalCount"
+        assert (result.get("items"), result.get("total")) == ([], 0)
+
+
+@pytest.mark.usefixtures("seeded_storage")
+class TestSeededStorageQueries:
+    """Test read-only storage queries against one shared seeded store."""
+
     def test_fetch_nonexistent_artifact(self):
         """Test fetching artifact that doesn't exist."""
-        reset_storage()
-        
         result = fetch_artifact("model", "nonexistent")
         assert result is None
 
-    def test_list_artifacts_empty(self):
-        """Test listing artifacts when storage is empty."""
-        reset_storage()
-        
-        query = ArtifactQuery()
-        result = list_artifacts(query)
-        
-        # API returns "items" not "artifacts", and "total" not "totalCount"
-        assert "items" in result
-        assert result["items"] == []
-        assert result["total"] == 0
-
-    def test_list_artifacts_with_data(self):
+    def test_list_artifacts_with_data(self, default_query):
         """Test listing artifacts with data in storage."""
-        reset_storage()
-        
-        # Add test artifacts
-        for i in range(3):
-            metadata = ArtifactMetadata(
-                id=f"test-id-{i}", name=f"package-{i}", type="model", version="1.0"
-            )
-            artifact = Artifact(metadata=metadata)
-            save_artifact(artifact)
-        
-        query = ArtifactQuery()
-        result = list_artifacts(query)
+        result = list_artifacts(default_query)
         
         # API returns "items" not "artifacts", and "total" not "totalCount"
-        assert len(result["items"]) == 3
-        assert result["total"] == 3
+        assert (len(result.get("items", [])), result.get("total")) == (3, 3)
 
     def test_list_artifacts_with_type_filter(self):
         """Test listing artifacts filtered by type."""
-        reset_storage()
-        
-        # Add mixed type artifacts
-        for artifact_type in ["model", "dataset"]:
-            for i in range(2):
-                metadata = ArtifactMetadata(
-                    id=f"{artifact_type}-{i}", name=f"package-{i}",
-                    type=artifact_type, version="1.0"
-                )
-                artifact = Artifact(metadata=metadata)
-                save_artifact(artifact)
-        
-        # Query only models
         query = ArtifactQuery(artifact_type="model")
         result = list_artifacts(query)
         
         # API returns "items" not "artifacts"
-        assert len(result["items"]) == 2
-        for artifact_dict in result["items"]:
-            assert artifact_dict["metadata"]["type"] == "model"
+        types = [artifact_dict["metadata"]["type"] for artifact_dict in result["items"]]
+        assert types == ["model", "model"]
 
     def test_duplicate_url_detection(self):
         """Test _duplicate_url_exists function."""
-        reset_storage()
-        
-        # Add artifact with URL
-        metadata = ArtifactMetadata(
-            id="test-id", name="test-package", type="model", version="1.0"
-        )
-        artifact = Artifact(metadata=metadata, data={"url": "https://example.com/unique"})
-        save_artifact(artifact)
-        
-        # Check for duplicate
         assert _duplicate_url_exists("model", "https://example.com/unique") is True
         assert _duplicate_url_exists("model", "https://example.com/different") is False
 
@@ -557,23 +509,27 @@ class TestRecordTiming:
         with pytest.raises(ValueError, match="test error"):
             failing_func()
 
+    def test_record_timing_window_is_bounded(self, monkeypatch):
+        """Test _record_timing keeps only the most recent durations."""
+        from collections import deque
+
+        window = deque(maxlen=3)
+        monkeypatch.setattr("app.core._REQUEST_TIMES", window)
+
+        @_record_timing
+        def quick_func():
+            return None
+
+        for _ in range(5):
+            quick_func()
+        assert len(window) == 3
+        assert _percentile(window, 0.5) >= 0.0
+
 
 class TestPersistence:
     """Test state persistence functions."""
 
     def test_persist_and_load_functions_exist(self):
-        """Test that persistence functions exist and can be called without errors."""
-        # Simple test to verify functions exist and don't crash
-        try:
-            _persist_state()
-        except Exception:
-            pass  # Expected to fail without proper S3/file setup
-        
-        try:
-            _load_state()  
-        except Exception:
-            pass  # Expected to fail without proper S3/file setup
-        
-        # Just verify the functions are callable
+        """Test that persistence functions exist; round trips are covered with tmp_path elsewhere."""
         assert callable(_persist_state)
-        assert callable(_load_state)
\ No newline at end of file
+        assert callable(_load_state)
@@ -1,18 +1,5 @@
 """
 Comprehensive tests for src/core/config.py
 This file tests the Settings class and configuration loading functionality.
-TEMPORARILY DISABLED due to missing pydantic_settings dependency in CI environment.
+Backup copy: excluded from collection via collect_ignore in tests/conftest.py.
 """
-
-import pytest
-
-# Skip this entire module due to missing pydantic_settings dependency in CI
-pytestmark = pytest.mark.skip(reason="Missing pydantic_settings dependency in CI environment")
-
-
-class TestSettings:
-    """Test the Settings class configuration loading and validation."""
-
-    def test_placeholder_skipped(self):
-        """Placeholder test - entire module is skipped due to dependency issues."""
-        pass
\ No newline at end of file
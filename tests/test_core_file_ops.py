@@ -0,0 +1,82 @@
+"""
+Tests for app/core.py artifact handling of file content (ZIP uploads, large payloads).
+
+Split from test_core_advanced_coverage.py so only these tests pay for building the
+ZIP and 1 MB base64 fixtures.
+"""
+
+import base64
+import zipfile
+from io import BytesIO
+
+import pytest
+
+from app.core import (
+    ArtifactMetadata,
+    Artifact,
+    save_artifact,
+    _calculate_artifact_size_mb,
+)
+
+
+def _build_zip_b64():
+    """Build the small two-file ZIP used by content tests, base64-encoded."""
+    zip_buffer = BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w', compression=zipfile.ZIP_STORED) as zip_file:
+        zip_file.writestr('test.txt', 'Hello, World!')
+        zip_file.writestr('subdir/another.txt', 'Another file')
+    return base64.b64encode(zip_buffer.getvalue()).decode()
+
+
+# Deterministic payloads built once at import rather than on every test run
+_LARGE_CONTENT_B64 = base64.b64encode(b"x" * (1024 * 1024)).decode()
+_ZIP_CONTENT_B64 = _build_zip_b64()
+
+pytestmark = pytest.mark.usefixtures("isolated_registry_storage", "clean_registry_storage")
+
+
+class TestFileOperationsAndContent:
+    """Test file operations and content handling."""
+
+    def test_artifact_with_zip_content(self):
+        """Test artifact with ZIP file content."""
+        metadata = ArtifactMetadata(
+            id="zip-test",
+            name="zip-artifact",
+            type="package",
+            version="1.0.0"
+        )
+        artifact = Artifact(
+            metadata=metadata,
+            data={"Content": _ZIP_CONTENT_B64, "JSProgram": "true"}
+        )
+
+        result = save_artifact(artifact)
+
+        assert result.metadata.id == "zip-test"
+        assert "Content" in result.data
+
+    def test_artifact_with_large_content(self):
+        """Test artifact with large content."""
+        metadata = ArtifactMetadata(
+            id="large-test",
+            name="large-artifact",
+            type="package",
+            version="1.0.0"
+        )
+        artifact = Artifact(
+            metadata=metadata,
+            data={"Content": _LARGE_CONTENT_B64}
+        )
+
+        result = save_artifact(artifact)
+
+        assert result.metadata.id == "large-test"
+
+        # Test size calculation - pass the whole artifact, not just data
+        size_mb = _calculate_artifact_size_mb(result)
+        assert size_mb >= 0  # Size will be 0 without explicit size field
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -44,6 +44,14 @@ class TestUtilityFunctions:
         assert _safe_int("", 7) == 7
         assert _safe_int(None, 999) == 999
 
+    def test_safe_int_non_decimal_inputs(self):
+        """Test _safe_int inputs that bypass the fast paths."""
+        assert _safe_int(25, 0) == 25
+        assert _safe_int(" 12 ", 0) == 12
+        assert _safe_int("+5", 0) == 5
+        assert _safe_int(3.9, 0) == 3
+        assert _safe_int("²", 8) == 8
+
     def test_parse_bearer_valid(self):
         """Test bearer token parsing with valid input."""
         result = _parse_bearer("Bearer abc123")
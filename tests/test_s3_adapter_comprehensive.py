@@ -309,6 +309,28 @@ class TestS3StorageFileOperations:
         assert meta["size"] == len(b"content")  # Falls back to body length
         assert meta["content_type"] == "application/octet-stream"  # Default
 
+    @patch("app.s3_adapter.s3_client")
+    @patch("app.s3_adapter.S3_BUCKET", "test-bucket")
+    def test_head_object_with_version(self, mock_client):
+        """Test head_object returns metadata without reading a body."""
+        self.storage.enabled = True
+        self.storage.bucket = "test-bucket"
+
+        mock_client.head_object.return_value = {"ContentLength": 42, "ContentType": "application/zip"}
+
+        meta = self.storage.head_object("test.zip", "v123")
+
+        assert meta == {"size": 42, "content_type": "application/zip"}
+        mock_client.head_object.assert_called_once_with(Bucket="test-bucket", Key="test.zip", VersionId="v123")
+        mock_client.get_object.assert_not_called()
+
+    def test_head_object_disabled_storage(self):
+        """Test head_object with disabled storage raises error."""
+        self.storage.enabled = False
+
+        with pytest.raises(RuntimeError, match="S3Storage not enabled"):
+            self.storage.head_object("test.txt")
+
     def test_generate_presigned_url_disabled_storage(self):
         """Test presigned URL generation with disabled storage."""
         self.storage.enabled = False